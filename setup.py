@@ -34,10 +34,10 @@ setup(
         "pandas>=1.5.0",
         "click>=8.0.0",
         "colorama>=0.4.0",
-        "tabulate>=0.9.0",
         "pydantic>=2.0.0",
         "jsonschema>=4.0.0",
-        "tqdm>=4.64.0"
+        "tqdm>=4.64.0",
+        "orjson>=3.8.0"
     ],
     extras_require={
         "dev": [
@@ -45,7 +45,8 @@ setup(
             "pytest-cov>=4.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
-            "mypy>=1.0.0"
+            "mypy>=1.0.0",
+            "tabulate>=0.9.0"
         ]
     },
     entry_points={
@@ -9,6 +9,7 @@ import pandas as pd
 from typing import List, Dict, Tuple, Optional, Union
 import math
 import statistics
+from collections import OrderedDict
 from decimal import Decimal, ROUND_HALF_UP
 import logging
 
@@ -16,6 +17,9 @@ from ..core.models import Lootbox, LootboxItem, RarityTier, LootboxAnalytics
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct lootbox configurations whose full analysis is memoized
+ANALYSIS_CACHE_SIZE = 256
+
 
 class ExpectedValueCalculator:
     """
@@ -24,6 +28,7 @@ class ExpectedValueCalculator:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._analysis_cache: "OrderedDict[tuple, LootboxAnalytics]" = OrderedDict()
     
     def calculate_expected_value(self, lootbox: Lootbox) -> float:
         """
@@ -236,16 +241,46 @@ class ExpectedValueCalculator:
         
         return profit_prob
     
+    @staticmethod
+    def _analysis_key(lootbox: Lootbox) -> tuple:
+        """Fingerprint every lootbox field that feeds into the full analysis"""
+        return (
+            lootbox.name,
+            lootbox.cost,
+            tuple(
+                (item.name, item.value, item.rarity.value, item.probability)
+                for item in lootbox.items
+            )
+        )
+    
     def generate_full_analysis(self, lootbox: Lootbox) -> LootboxAnalytics:
         """
         Generate comprehensive analytics for a lootbox
         
+        Results are memoized on the lootbox contents, so repeated calls for an
+        unchanged configuration are a dictionary lookup. The returned object is
+        shared between callers and should be treated as read-only.
+        
         Args:
             lootbox: Lootbox configuration
             
         Returns:
             Complete analytics object
         """
+        key = self._analysis_key(lootbox)
+        analytics = self._analysis_cache.get(key)
+        if analytics is not None:
+            self._analysis_cache.move_to_end(key)
+            return analytics
+        
+        analytics = self._compute_full_analysis(lootbox)
+        self._analysis_cache[key] = analytics
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analytics
+    
+    def _compute_full_analysis(self, lootbox: Lootbox) -> LootboxAnalytics:
+        """Build the analytics object without consulting the cache"""
         expected_value = self.calculate_expected_value(lootbox)
         variance = self.calculate_variance(lootbox)
         std_deviation = self.calculate_standard_deviation(lootbox)
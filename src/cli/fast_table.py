@@ -0,0 +1,151 @@
+"""
+Grid Table Rendering for the CLI
+
+Produces the same output as tabulate's 'grid' format with its default
+alignment and number formatting, including multiline cells, for tables of
+plain single-width text and numbers. Tabs are expanded to spaces first
+(tabulate misaligns the borders around them). Each column is classified
+and formatted in one pass, and the separators are built once per table.
+"""
+import math
+from io import StringIO
+from typing import Any, List, Sequence, Tuple
+
+# Column kinds, ordered from least to most generic as tabulate ranks them
+_EMPTY, _BOOL, _INT, _FLOAT, _TEXT = range(5)
+
+# Extra width given to every column beyond its header, as in tabulate
+HEADER_PADDING = 2
+
+
+def _cell_kind(cell: Any) -> int:
+    """Classify a cell the way tabulate does, including numeric strings"""
+    if cell is None or cell == "":
+        return _EMPTY
+    if isinstance(cell, bool):
+        return _BOOL
+    if isinstance(cell, int):
+        return _INT
+    if isinstance(cell, float):
+        return _FLOAT
+    if isinstance(cell, str):
+        try:
+            int(cell)
+            return _INT
+        except ValueError:
+            pass
+        try:
+            number = float(cell)
+        except ValueError:
+            return _TEXT
+        if math.isinf(number) or math.isnan(number):
+            return _FLOAT if cell.lower() in ("inf", "-inf", "nan") else _TEXT
+        return _FLOAT
+    return _TEXT
+
+
+def _decimal_places(text: str) -> int:
+    """Digits after the decimal point (or exponent marker), -1 if there are none"""
+    pos = text.rfind(".")
+    if pos < 0:
+        pos = text.lower().rfind("e")
+    return len(text) - pos - 1 if pos >= 0 else -1
+
+
+def _format_column(cells: Sequence[Any]) -> Tuple[List[str], bool]:
+    """
+    Format one column's cells and pad numbers so they line up
+    
+    Args:
+        cells: Column cells
+    
+    Returns:
+        Tuple of (formatted cells, whether the column is right-aligned);
+        float columns are padded on the right so their decimal points align
+    """
+    kinds = [_cell_kind(cell) for cell in cells]
+    kind = max(kinds, default=_EMPTY)
+    
+    if kind == _INT:
+        return ["" if k == _EMPTY else str(cell) for cell, k in zip(cells, kinds)], True
+    
+    if kind == _FLOAT:
+        texts = [
+            "" if k == _EMPTY else format(float(cell), "g") for cell, k in zip(cells, kinds)
+        ]
+        places = [_decimal_places(text) for text in texts]
+        most = max(places)
+        return [text + " " * (most - n) for text, n in zip(texts, places)], True
+    
+    return ["" if cell is None else str(cell).strip() for cell in cells], False
+
+
+def _cell_lines(text: str, multiline: bool) -> List[str]:
+    """
+    Split a formatted cell into its display lines
+    
+    In a multiline table an empty cell has no lines at all, so a row of
+    empty cells takes no height, as in tabulate.
+    """
+    text = text.expandtabs()
+    return text.splitlines() if multiline else [text]
+
+
+def render_grid(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    """
+    Render rows as a grid table
+    
+    Args:
+        headers: Column headers
+        rows: Table rows; numeric columns (including numeric strings) are
+            right-aligned on the decimal point, all other columns are
+            left-aligned. Cells containing newlines span several lines.
+    
+    Returns:
+        Rendered table without a trailing newline
+    """
+    formatted = [_format_column([row[i] for row in rows]) for i in range(len(headers))]
+    right_aligned = [right for _, right in formatted]
+    
+    # Any line break in the raw cells (even one that formatting strips)
+    # switches the whole table to multiline rows
+    texts = [str(header) for header in headers] + [str(cell) for row in rows for cell in row]
+    multiline = any("\n" in text or "\r" in text for text in texts)
+    columns = [[_cell_lines(cell, multiline) for cell in cells] for cells, _ in formatted]
+    header_lines = [_cell_lines(str(header), multiline) for header in headers]
+    
+    # Single pass over the cell lines for column widths
+    widths = [max(map(len, lines), default=0) + HEADER_PADDING for lines in header_lines]
+    for i, column in enumerate(columns):
+        for lines in column:
+            for line in lines:
+                if len(line) > widths[i]:
+                    widths[i] = len(line)
+    
+    # Separators are identical for every row, so build them once
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+\n"
+    header_separator = "+" + "+".join("=" * (width + 2) for width in widths) + "+\n"
+    
+    def write_row(buf: StringIO, row: Sequence[List[str]]):
+        # Cells with fewer lines than the tallest are padded at the bottom
+        height = max(map(len, row), default=0)
+        for n in range(height):
+            buf.write("|")
+            for lines, width, right in zip(row, widths, right_aligned):
+                line = lines[n] if n < len(lines) else ""
+                buf.write(" ")
+                buf.write(line.rjust(width) if right else line.ljust(width))
+                buf.write(" |")
+            buf.write("\n")
+    
+    buf = StringIO()
+    buf.write(separator)
+    write_row(buf, header_lines)
+    buf.write(header_separator)
+    for row in zip(*columns):
+        write_row(buf, row)
+        buf.write(separator)
+    if not rows:
+        buf.write(separator)
+    
+    return buf.getvalue().rstrip("\n")
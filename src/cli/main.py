@@ -4,24 +4,30 @@ Command Line Interface for Lootbox Probability Toolkit
 Provides an intuitive terminal interface for designing, analyzing,
 and optimizing lootbox configurations.
 """
+import asyncio
 import click
+import csv
 import json
 import sys
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
-from tabulate import tabulate
 from colorama import init, Fore, Back, Style
+import orjson
 import pandas as pd
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.core.models import Lootbox, LootboxItem, RarityTier, OptimizationConstraints
+from src.core.models import (
+    Lootbox, LootboxItem, LootboxAnalytics, RarityTier, OptimizationConstraints,
+    RARITY_CODE, RARITY_TITLES, save_many
+)
 from src.calculator.expected_value import ExpectedValueCalculator
 from src.simulator.monte_carlo import MonteCarloSimulator
 from src.optimizer.probability_optimizer import ProbabilityOptimizer
+from src.cli.fast_table import render_grid
 
 # Initialize colorama
 init()
@@ -30,6 +36,86 @@ init()
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Rarity tiers, their breakdown keys and display titles, aligned by index
+_RARITIES = tuple(RarityTier)
+_RARITY_KEYS = tuple(rarity.value for rarity in _RARITIES)
+_RARITY_TITLES = tuple(RARITY_TITLES)
+_RARITY_TITLE_BY_KEY = dict(zip(_RARITY_KEYS, _RARITY_TITLES))
+
+# Items table columns for `show`: key -> (header, cell formatter)
+ITEM_COLUMNS = {
+    'name': ('Name', lambda item: item.name),
+    'rarity': ('Rarity', lambda item: _RARITY_TITLES[RARITY_CODE[item.rarity]]),
+    'value': ('Value', lambda item: f"${item.value:.2f}"),
+    'probability': ('Probability', lambda item: f"{item.probability*100:.4f}%"),
+    'description': ('Description', lambda item: item.description or "")
+}
+
+
+# Predefined lootbox templates for `template`
+_TEMPLATE_DEFS = {
+    'balanced': {
+        'name': 'Balanced Box',
+        'description': 'A well-balanced lootbox with fair odds',
+        'items': [
+            {'name': 'Common Coin', 'value': 0.10, 'rarity': RarityTier.COMMON, 'probability': 0.50},
+            {'name': 'Uncommon Token', 'value': 0.50, 'rarity': RarityTier.UNCOMMON, 'probability': 0.25},
+            {'name': 'Rare Gem', 'value': 1.50, 'rarity': RarityTier.RARE, 'probability': 0.15},
+            {'name': 'Epic Crystal', 'value': 4.00, 'rarity': RarityTier.EPIC, 'probability': 0.08},
+            {'name': 'Legendary Artifact', 'value': 12.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.02}
+        ]
+    },
+    'csgo': {
+        'name': 'CS:GO Style Case',
+        'description': 'CS:GO-inspired rarity distribution',
+        'items': [
+            {'name': 'Consumer Grade', 'value': 0.05, 'rarity': RarityTier.COMMON, 'probability': 0.7992},
+            {'name': 'Industrial Grade', 'value': 0.15, 'rarity': RarityTier.UNCOMMON, 'probability': 0.1598},
+            {'name': 'Mil-Spec', 'value': 0.75, 'rarity': RarityTier.RARE, 'probability': 0.032},
+            {'name': 'Restricted', 'value': 3.50, 'rarity': RarityTier.EPIC, 'probability': 0.0064},
+            {'name': 'Classified', 'value': 15.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.0013},
+            {'name': 'Covert', 'value': 75.00, 'rarity': RarityTier.MYTHIC, 'probability': 0.0013}
+        ]
+    },
+    'high_variance': {
+        'name': 'High Variance Box',
+        'description': 'High risk, high reward lootbox',
+        'items': [
+            {'name': 'Nothing', 'value': 0.01, 'rarity': RarityTier.COMMON, 'probability': 0.85},
+            {'name': 'Small Prize', 'value': 0.25, 'rarity': RarityTier.UNCOMMON, 'probability': 0.10},
+            {'name': 'Medium Prize', 'value': 2.00, 'rarity': RarityTier.RARE, 'probability': 0.04},
+            {'name': 'Jackpot', 'value': 50.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.01}
+        ]
+    },
+    'low_variance': {
+        'name': 'Low Variance Box',
+        'description': 'Consistent, predictable returns',
+        'items': [
+            {'name': 'Small Win', 'value': 0.80, 'rarity': RarityTier.COMMON, 'probability': 0.40},
+            {'name': 'Medium Win', 'value': 1.20, 'rarity': RarityTier.UNCOMMON, 'probability': 0.35},
+            {'name': 'Good Win', 'value': 1.80, 'rarity': RarityTier.RARE, 'probability': 0.20},
+            {'name': 'Great Win', 'value': 3.00, 'rarity': RarityTier.EPIC, 'probability': 0.05}
+        ]
+    }
+}
+
+
+def _build_lootbox(template_config: dict, cost: float = 2.0) -> Lootbox:
+    """Build a validated lootbox from a template definition"""
+    items = [LootboxItem(**item_config) for item_config in template_config['items']]
+    return Lootbox(
+        name=template_config['name'],
+        description=template_config['description'],
+        cost=cost,
+        items=items
+    )
+
+
+# Templates are static, so validate them once at import and copy per use
+TEMPLATE_PROTOTYPES: Dict[str, Lootbox] = {
+    key: _build_lootbox(template_config) for key, template_config in _TEMPLATE_DEFS.items()
+}
+
 
 class LootboxCLI:
     """Main CLI application for lootbox toolkit"""
@@ -38,7 +124,28 @@ class LootboxCLI:
         self.calculator = ExpectedValueCalculator()
         self.simulator = MonteCarloSimulator()
         self.optimizer = ProbabilityOptimizer()
-        self.current_lootbox: Optional[Lootbox] = None
+        self._current_lootbox: Optional[Lootbox] = None
+        # id(lootbox) -> (lootbox, analytics); holding the lootbox keeps its id from being reused
+        self._analytics_cache: Dict[int, Tuple[Lootbox, LootboxAnalytics]] = {}
+    
+    @property
+    def current_lootbox(self) -> Optional[Lootbox]:
+        """Lootbox the commands operate on"""
+        return self._current_lootbox
+    
+    @current_lootbox.setter
+    def current_lootbox(self, lootbox: Optional[Lootbox]):
+        self._current_lootbox = lootbox
+        self._analytics_cache.clear()
+    
+    def analytics_for(self, lootbox: Lootbox) -> LootboxAnalytics:
+        """Get full analytics for a lootbox, computed once per lootbox object"""
+        key = id(lootbox)
+        entry = self._analytics_cache.get(key)
+        if entry is None or entry[0] is not lootbox:
+            entry = (lootbox, self.calculator.generate_full_analysis(lootbox))
+            self._analytics_cache[key] = entry
+        return entry[1]
         
     def print_header(self, title: str):
         """Print a formatted header"""
@@ -67,22 +174,11 @@ def cli(ctx):
     ctx.obj['app'] = LootboxCLI()
 
 
-@cli.command()
-@click.option('--name', prompt='Lootbox name', help='Name for the lootbox')
-@click.option('--cost', prompt='Lootbox cost ($0.50-$4.00)', type=float, help='Cost of the lootbox')
-@click.option('--description', help='Optional description')
-@click.pass_context
-def create(ctx, name: str, cost: float, description: str):
-    """Create a new lootbox configuration"""
-    app = ctx.obj['app']
-    app.print_header("CREATE NEW LOOTBOX")
-    
-    if not 0.5 <= cost <= 4.0:
-        app.print_error("Cost must be between $0.50 and $4.00")
-        return
-    
-    # Interactive item creation
+def _prompt_items(app: LootboxCLI) -> Tuple[List[LootboxItem], float]:
+    """Interactively collect items; returns the items and their probability total"""
     items = []
+    seen_names = set()
+    total_prob = 0.0
     print("Add items to your lootbox. Press Enter without a name to finish.")
     
     while True:
@@ -92,18 +188,22 @@ def create(ctx, name: str, cost: float, description: str):
         if not item_name.strip():
             break
         
+        if item_name in seen_names:
+            app.print_error(f"Item '{item_name}' already exists, names must be unique")
+            continue
+        
         item_value = click.prompt("Item value ($)", type=float)
         
         print("Available rarities:")
-        for i, rarity in enumerate(RarityTier, 1):
-            print(f"  {i}. {rarity.value.title()}")
+        for i, title in enumerate(_RARITY_TITLES, 1):
+            print(f"  {i}. {title}")
         
         rarity_choice = click.prompt("Choose rarity (1-6)", type=int)
         if not 1 <= rarity_choice <= 6:
             app.print_error("Invalid rarity choice")
             continue
         
-        rarity = list(RarityTier)[rarity_choice - 1]
+        rarity = _RARITIES[rarity_choice - 1]
         probability = click.prompt("Probability (0.0-1.0)", type=float)
         
         if not 0 <= probability <= 1:
@@ -121,26 +221,91 @@ def create(ctx, name: str, cost: float, description: str):
         )
         
         items.append(item)
+        seen_names.add(item_name)
+        total_prob += probability
         app.print_success(f"Added: {item}")
     
+    return items, total_prob
+
+
+def _read_items(items_file: Optional[str], items_json: Optional[str]) -> List[LootboxItem]:
+    """Parse items in one go from a CSV/JSON file or a JSON string"""
+    if items_json is not None:
+        rows = orjson.loads(items_json)
+    elif items_file.lower().endswith('.csv'):
+        with open(items_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        rows = orjson.loads(Path(items_file).read_bytes())
+    
+    # Accept a full lootbox document as well as a bare list of items
+    if isinstance(rows, dict):
+        rows = rows.get('items', [])
+    
+    return [
+        LootboxItem(**{**row, 'description': row.get('description') or None})
+        for row in rows
+    ]
+
+
+@cli.command()
+@click.option('--name', prompt='Lootbox name', help='Name for the lootbox')
+@click.option('--cost', prompt='Lootbox cost ($0.50-$4.00)', type=float, help='Cost of the lootbox')
+@click.option('--description', help='Optional description')
+@click.option('--items-file', type=click.Path(exists=True, dir_okay=False),
+              help='CSV or JSON file with the items (skips interactive entry)')
+@click.option('--items-json', help='JSON array of items (skips interactive entry)')
+@click.pass_context
+def create(ctx, name: str, cost: float, description: str,
+           items_file: Optional[str], items_json: Optional[str]):
+    """Create a new lootbox configuration"""
+    app = ctx.obj['app']
+    app.print_header("CREATE NEW LOOTBOX")
+    
+    if not 0.5 <= cost <= 4.0:
+        app.print_error("Cost must be between $0.50 and $4.00")
+        return
+    
+    if items_file or items_json:
+        # Bulk path: parse everything at once, then check names and total in one pass
+        try:
+            items = _read_items(items_file, items_json)
+        except Exception as e:
+            app.print_error(f"Failed to read items: {str(e)}")
+            return
+        
+        seen_names = set()
+        total_prob = 0.0
+        for item in items:
+            if item.name in seen_names:
+                app.print_error(f"Item '{item.name}' appears more than once, names must be unique")
+                return
+            seen_names.add(item.name)
+            total_prob += item.probability
+    else:
+        items, total_prob = _prompt_items(app)
+    
     if not items:
         app.print_error("Must add at least one item")
         return
     
+    if total_prob <= 0:
+        app.print_error("At least one item must have a non-zero probability")
+        return
+    
     try:
-        # Normalize probabilities
-        total_prob = sum(item.probability for item in items)
+        # Items, names and cost were validated on entry, so skip the model
+        # validators and normalize with the running total
         if abs(total_prob - 1.0) > 1e-6:
             app.print_warning(f"Probabilities sum to {total_prob:.4f}, normalizing to 1.0")
-            for item in items:
-                item.probability = item.probability / total_prob
         
-        lootbox = Lootbox(
+        lootbox = Lootbox.model_construct(
             name=name,
             cost=cost,
             description=description,
             items=items
         )
+        lootbox.normalize_probabilities(precomputed_total=total_prob)
         
         ctx.obj['app'].current_lootbox = lootbox
         app.print_success(f"Created lootbox '{name}' with {len(items)} items")
@@ -152,7 +317,7 @@ def create(ctx, name: str, cost: float, description: str):
         print(f"\n{Fore.CYAN}Quick Analysis:{Style.RESET_ALL}")
         print(f"Expected Value: ${ev:.4f}")
         print(f"House Edge: {he*100:.2f}%")
-        print(f"Player Rating: {app.calculator.generate_full_analysis(lootbox).get_player_value_rating()}")
+        print(f"Player Rating: {app.analytics_for(lootbox).get_player_value_rating()}")
         
     except Exception as e:
         app.print_error(f"Failed to create lootbox: {str(e)}")
@@ -218,7 +383,7 @@ def analyze(ctx):
     app.print_header(f"ANALYSIS: {app.current_lootbox.name}")
     
     # Generate full analysis
-    analytics = app.calculator.generate_full_analysis(app.current_lootbox)
+    analytics = app.analytics_for(app.current_lootbox)
     
     # Basic metrics
     print(f"{Fore.CYAN}Basic Metrics:{Style.RESET_ALL}")
@@ -241,11 +406,11 @@ def analyze(ctx):
     # Rarity breakdown
     print(f"\n{Fore.CYAN}Rarity Analysis:{Style.RESET_ALL}")
     rarity_data = []
-    for rarity in RarityTier:
-        breakdown = analytics.rarity_breakdown[rarity.value]
+    for i, key in enumerate(_RARITY_KEYS):
+        breakdown = analytics.rarity_breakdown[key]
         if breakdown['item_count'] > 0:
             rarity_data.append([
-                rarity.value.title(),
+                _RARITY_TITLES[i],
                 breakdown['item_count'],
                 f"{breakdown['total_probability']*100:.2f}%",
                 f"${breakdown['average_value']:.2f}",
@@ -253,10 +418,9 @@ def analyze(ctx):
             ])
     
     if rarity_data:
-        print(tabulate(
-            rarity_data,
-            headers=['Rarity', 'Items', 'Probability', 'Avg Value', 'EV Contribution'],
-            tablefmt='grid'
+        print(render_grid(
+            ['Rarity', 'Items', 'Probability', 'Avg Value', 'EV Contribution'],
+            rarity_data
         ))
     
     # Value percentiles
@@ -265,10 +429,9 @@ def analyze(ctx):
     for p_name, value in analytics.value_percentiles.items():
         percentile_data.append([p_name.upper(), f"${value:.2f}"])
     
-    print(tabulate(
-        percentile_data,
-        headers=['Percentile', 'Value'],
-        tablefmt='grid'
+    print(render_grid(
+        ['Percentile', 'Value'],
+        percentile_data
     ))
 
 
@@ -294,7 +457,8 @@ def simulate(ctx, simulations: int, seed: Optional[int]):
     result = app.simulator.simulate_multiple_openings(
         app.current_lootbox,
         simulations,
-        show_progress=True
+        show_progress=True,
+        sampling_arrays=app.current_lootbox.sampling_arrays()
     )
     
     # Display results
@@ -314,12 +478,11 @@ def simulate(ctx, simulations: int, seed: Optional[int]):
     rarity_data = []
     for rarity, count in result.rarity_distribution.items():
         percentage = (count / simulations) * 100
-        rarity_data.append([rarity.title(), count, f"{percentage:.2f}%"])
+        rarity_data.append([_RARITY_TITLE_BY_KEY[rarity], count, f"{percentage:.2f}%"])
     
-    print(tabulate(
-        rarity_data,
-        headers=['Rarity', 'Count', 'Percentage'],
-        tablefmt='grid'
+    print(render_grid(
+        ['Rarity', 'Count', 'Percentage'],
+        rarity_data
     ))
 
 
@@ -372,8 +535,10 @@ def optimize(ctx, target_house_edge: float, method: str):
 
 
 @cli.command()
+@click.option('--columns', default=','.join(ITEM_COLUMNS),
+              help=f"Comma-separated item columns to display ({', '.join(ITEM_COLUMNS)})")
 @click.pass_context
-def show(ctx):
+def show(ctx, columns: str):
     """Show current lootbox configuration"""
     app = ctx.obj['app']
     
@@ -381,6 +546,12 @@ def show(ctx):
         app.print_error("No lootbox loaded. Create or load a lootbox first.")
         return
     
+    column_keys = [key.strip().lower() for key in columns.split(',') if key.strip()]
+    unknown = [key for key in column_keys if key not in ITEM_COLUMNS]
+    if unknown or not column_keys:
+        app.print_error(f"Invalid columns {columns!r}. Choose from: {', '.join(ITEM_COLUMNS)}")
+        return
+    
     lootbox = app.current_lootbox
     app.print_header(f"LOOTBOX: {lootbox.name}")
     
@@ -390,23 +561,13 @@ def show(ctx):
     print(f"Cost: ${lootbox.cost:.2f}")
     print(f"Items: {len(lootbox.items)}")
     
-    # Items table
+    # Items table, formatting only the requested columns
     print(f"\n{Fore.CYAN}Items:{Style.RESET_ALL}")
-    items_data = []
-    for item in lootbox.items:
-        items_data.append([
-            item.name,
-            item.rarity.value.title(),
-            f"${item.value:.2f}",
-            f"{item.probability*100:.4f}%",
-            item.description or ""
-        ])
-    
-    print(tabulate(
-        items_data,
-        headers=['Name', 'Rarity', 'Value', 'Probability', 'Description'],
-        tablefmt='grid'
-    ))
+    headers = [ITEM_COLUMNS[key][0] for key in column_keys]
+    formatters = tuple(ITEM_COLUMNS[key][1] for key in column_keys)
+    items_data = [[fmt(item) for fmt in formatters] for item in lootbox.items]
+    
+    print(render_grid(headers, items_data))
 
 
 @cli.command()
@@ -422,72 +583,8 @@ def template(ctx, template: str, cost: float):
         app.print_error("Cost must be between $0.50 and $4.00")
         return
     
-    templates = {
-        'balanced': {
-            'name': 'Balanced Box',
-            'description': 'A well-balanced lootbox with fair odds',
-            'items': [
-                {'name': 'Common Coin', 'value': 0.10, 'rarity': RarityTier.COMMON, 'probability': 0.50},
-                {'name': 'Uncommon Token', 'value': 0.50, 'rarity': RarityTier.UNCOMMON, 'probability': 0.25},
-                {'name': 'Rare Gem', 'value': 1.50, 'rarity': RarityTier.RARE, 'probability': 0.15},
-                {'name': 'Epic Crystal', 'value': 4.00, 'rarity': RarityTier.EPIC, 'probability': 0.08},
-                {'name': 'Legendary Artifact', 'value': 12.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.02}
-            ]
-        },
-        'csgo': {
-            'name': 'CS:GO Style Case',
-            'description': 'CS:GO-inspired rarity distribution',
-            'items': [
-                {'name': 'Consumer Grade', 'value': 0.05, 'rarity': RarityTier.COMMON, 'probability': 0.7992},
-                {'name': 'Industrial Grade', 'value': 0.15, 'rarity': RarityTier.UNCOMMON, 'probability': 0.1598},
-                {'name': 'Mil-Spec', 'value': 0.75, 'rarity': RarityTier.RARE, 'probability': 0.032},
-                {'name': 'Restricted', 'value': 3.50, 'rarity': RarityTier.EPIC, 'probability': 0.0064},
-                {'name': 'Classified', 'value': 15.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.0013},
-                {'name': 'Covert', 'value': 75.00, 'rarity': RarityTier.MYTHIC, 'probability': 0.0013}
-            ]
-        },
-        'high_variance': {
-            'name': 'High Variance Box',
-            'description': 'High risk, high reward lootbox',
-            'items': [
-                {'name': 'Nothing', 'value': 0.01, 'rarity': RarityTier.COMMON, 'probability': 0.85},
-                {'name': 'Small Prize', 'value': 0.25, 'rarity': RarityTier.UNCOMMON, 'probability': 0.10},
-                {'name': 'Medium Prize', 'value': 2.00, 'rarity': RarityTier.RARE, 'probability': 0.04},
-                {'name': 'Jackpot', 'value': 50.00, 'rarity': RarityTier.LEGENDARY, 'probability': 0.01}
-            ]
-        },
-        'low_variance': {
-            'name': 'Low Variance Box',
-            'description': 'Consistent, predictable returns',
-            'items': [
-                {'name': 'Small Win', 'value': 0.80, 'rarity': RarityTier.COMMON, 'probability': 0.40},
-                {'name': 'Medium Win', 'value': 1.20, 'rarity': RarityTier.UNCOMMON, 'probability': 0.35},
-                {'name': 'Good Win', 'value': 1.80, 'rarity': RarityTier.RARE, 'probability': 0.20},
-                {'name': 'Great Win', 'value': 3.00, 'rarity': RarityTier.EPIC, 'probability': 0.05}
-            ]
-        }
-    }
-    
-    template_config = templates[template]
-    
-    # Create items
-    items = []
-    for item_config in template_config['items']:
-        item = LootboxItem(
-            name=item_config['name'],
-            value=item_config['value'],
-            rarity=item_config['rarity'],
-            probability=item_config['probability']
-        )
-        items.append(item)
-    
-    # Create lootbox
-    lootbox = Lootbox(
-        name=template_config['name'],
-        description=template_config['description'],
-        cost=cost,
-        items=items
-    )
+    # Copy the prebuilt prototype; cost was range-checked above
+    lootbox = TEMPLATE_PROTOTYPES[template].model_copy(deep=True, update={'cost': cost})
     
     ctx.obj['app'].current_lootbox = lootbox
     app.print_success(f"Created '{template}' template lootbox")
@@ -503,8 +600,9 @@ def template(ctx, template: str, cost: float):
 @click.option('--min-cost', default=0.5, help='Minimum cost to analyze')
 @click.option('--max-cost', default=4.0, help='Maximum cost to analyze')
 @click.option('--house-edge', default=0.15, help='Target house edge')
+@click.option('--workers', default=1, help='Worker processes for the cost points (1 = run in-process)')
 @click.pass_context
-def cost_analysis(ctx, min_cost: float, max_cost: float, house_edge: float):
+def cost_analysis(ctx, min_cost: float, max_cost: float, house_edge: float, workers: int):
     """Analyze optimal configurations across cost range"""
     app = ctx.obj['app']
     
@@ -515,35 +613,89 @@ def cost_analysis(ctx, min_cost: float, max_cost: float, house_edge: float):
     app.print_header("COST RANGE ANALYSIS")
     
     # Run optimization across cost range
-    results = app.optimizer.optimize_for_cost_range(
-        app.current_lootbox.items,
-        min_cost,
-        max_cost,
-        house_edge
-    )
+    if workers > 1:
+        results = app.optimizer.optimize_for_cost_range_parallel(
+            app.current_lootbox.items,
+            min_cost,
+            max_cost,
+            house_edge,
+            n_workers=workers
+        )
+    else:
+        results = app.optimizer.optimize_for_cost_range(
+            app.current_lootbox.items,
+            min_cost,
+            max_cost,
+            house_edge
+        )
     
     # Display results table
     analysis_data = []
     for result in results:
         if result.success and result.optimized_lootbox:
             lootbox = result.optimized_lootbox
+            analytics = app.analytics_for(lootbox)
             analysis_data.append([
                 f"${lootbox.cost:.2f}",
-                f"${lootbox.get_expected_value():.4f}",
-                f"{lootbox.get_house_edge()*100:.2f}%",
-                app.calculator.generate_full_analysis(lootbox).get_risk_level(),
-                app.calculator.generate_full_analysis(lootbox).get_player_value_rating()
+                f"${analytics.expected_value:.4f}",
+                f"{analytics.house_edge*100:.2f}%",
+                analytics.get_risk_level(),
+                analytics.get_player_value_rating()
             ])
     
     if analysis_data:
-        print(tabulate(
-            analysis_data,
-            headers=['Cost', 'Expected Value', 'House Edge', 'Risk Level', 'Player Rating'],
-            tablefmt='grid'
+        print(render_grid(
+            ['Cost', 'Expected Value', 'House Edge', 'Risk Level', 'Player Rating'],
+            analysis_data
         ))
     else:
         app.print_error("No successful optimizations found")
 
 
+@cli.command('export-all')
+@click.option('--min-cost', default=0.5, help='Minimum cost to analyze')
+@click.option('--max-cost', default=4.0, help='Maximum cost to analyze')
+@click.option('--house-edge', default=0.15, help='Target house edge')
+@click.option('--output-dir', default='outputs', help='Directory to write configurations to')
+@click.pass_context
+def export_all(ctx, min_cost: float, max_cost: float, house_edge: float, output_dir: str):
+    """Optimize across a cost range and save every configuration"""
+    app = ctx.obj['app']
+    
+    if not app.current_lootbox:
+        app.print_error("No lootbox loaded. Create or load a lootbox first.")
+        return
+    
+    app.print_header("EXPORT COST RANGE")
+    
+    results = app.optimizer.optimize_for_cost_range(
+        app.current_lootbox.items,
+        min_cost,
+        max_cost,
+        house_edge
+    )
+    lootboxes = [
+        result.optimized_lootbox for result in results
+        if result.success and result.optimized_lootbox
+    ]
+    
+    if not lootboxes:
+        app.print_error("No successful optimizations found")
+        return
+    
+    base_name = app.current_lootbox.name.lower().replace(' ', '_')
+    filepaths = [
+        os.path.join(output_dir, f"{base_name}_{lootbox.cost:.2f}.json")
+        for lootbox in lootboxes
+    ]
+    
+    try:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        asyncio.run(save_many(lootboxes, filepaths))
+        app.print_success(f"Saved {len(lootboxes)} configurations to {output_dir}")
+    except Exception as e:
+        app.print_error(f"Failed to export configurations: {str(e)}")
+
+
 if __name__ == '__main__':
     cli()
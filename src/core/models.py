@@ -1,12 +1,16 @@
 """
 Core data models for lootbox probability calculations
 """
+import asyncio
+import bisect
 from enum import Enum
-from typing import List, Dict, Optional, Union
-from pydantic import BaseModel, Field, validator
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from decimal import Decimal, ROUND_HALF_UP
-import json
+from pathlib import Path
 import logging
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -21,24 +25,33 @@ class RarityTier(str, Enum):
     MYTHIC = "mythic"
 
 
+# Integer codes and display titles for rarity tiers, in declaration order
+RARITY_CODE: Dict[RarityTier, int] = {tier: code for code, tier in enumerate(RarityTier)}
+RARITY_TITLES: List[str] = [tier.value.title() for tier in RarityTier]
+
+
 class LootboxItem(BaseModel):
     """
     Represents a single item that can be obtained from a lootbox
     """
+    model_config = ConfigDict(frozen=False, validate_assignment=False)
+    
     name: str = Field(..., description="Item name")
     value: float = Field(..., gt=0, description="Item value in USD")
     rarity: RarityTier = Field(..., description="Item rarity tier")
     probability: float = Field(..., ge=0, le=1, description="Probability of obtaining this item")
     description: Optional[str] = Field(None, description="Item description")
     
-    @validator('probability')
+    @field_validator('probability')
+    @classmethod
     def validate_probability(cls, v):
         """Ensure probability is valid"""
         if not 0 <= v <= 1:
             raise ValueError('Probability must be between 0 and 1')
         return v
     
-    @validator('value')
+    @field_validator('value')
+    @classmethod
     def validate_value(cls, v):
         """Ensure value is positive"""
         if v <= 0:
@@ -52,31 +65,53 @@ class LootboxItem(BaseModel):
 class Lootbox(BaseModel):
     """
     Represents a complete lootbox configuration
+    
+    The NumPy item columns behind sampling_arrays and rarity_codes are cached
+    per items list and rebuilt only when items is reassigned or resized, so
+    treat the list and its items as immutable once they are cached: replace
+    lootbox.items (or use clone_with_probs) rather than editing items in place.
     """
+    model_config = ConfigDict(frozen=False, validate_assignment=False)
+    
     name: str = Field(..., description="Lootbox name")
     description: Optional[str] = Field(None, description="Lootbox description")
     cost: float = Field(..., ge=0.5, le=1000.0, description="Lootbox cost in USD")
-    items: List[LootboxItem] = Field(..., min_items=1, description="Items in the lootbox")
+    items: List[LootboxItem] = Field(..., min_length=1, description="Items in the lootbox")
+    
+    # Lazily built NumPy views of the item columns (see sampling_arrays),
+    # valid for the items list identified by _columns_key
+    _values_np: Optional[np.ndarray] = PrivateAttr(default=None)
+    _probs_np: Optional[np.ndarray] = PrivateAttr(default=None)
+    _rarity_codes: Optional[np.ndarray] = PrivateAttr(default=None)
+    _columns_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
     
-    @validator('items')
+    @field_validator('items')
+    @classmethod
     def validate_items(cls, v):
         """Validate items list and probabilities"""
         if not v:
             raise ValueError('Lootbox must contain at least one item')
         
-        # Check total probability
-        total_prob = sum(item.probability for item in v)
+        # Accumulate total probability and detect duplicate names in one pass
+        total_prob = 0.0
+        seen_names = set()
+        has_duplicates = False
+        for item in v:
+            total_prob += item.probability
+            if item.name in seen_names:
+                has_duplicates = True
+            seen_names.add(item.name)
+        
         if abs(total_prob - 1.0) > 1e-6:
             raise ValueError(f'Total probability must equal 1.0, got {total_prob:.6f}')
         
-        # Check for duplicate names
-        names = [item.name for item in v]
-        if len(names) != len(set(names)):
+        if has_duplicates:
             raise ValueError('Item names must be unique')
         
         return v
     
-    @validator('cost')
+    @field_validator('cost')
+    @classmethod
     def validate_cost(cls, v):
         """Ensure cost is within acceptable range"""
         if not 0.5 <= v <= 1000.0:
@@ -93,7 +128,8 @@ class Lootbox(BaseModel):
     
     def get_items_by_rarity(self, rarity: RarityTier) -> List[LootboxItem]:
         """Get all items of a specific rarity"""
-        return [item for item in self.items if item.rarity == rarity]
+        matches = np.flatnonzero(self.rarity_codes() == RARITY_CODE[rarity])
+        return [self.items[j] for j in matches]
     
     def get_probability_by_rarity(self, rarity: RarityTier) -> float:
         """Get total probability for a specific rarity tier"""
@@ -109,12 +145,63 @@ class Lootbox(BaseModel):
             return 0.0
         return sum(item.value * item.probability for item in items) / total_prob
     
-    def normalize_probabilities(self):
-        """Normalize all item probabilities to sum to 1.0"""
-        total_prob = sum(item.probability for item in self.items)
+    def normalize_probabilities(self, precomputed_total: Optional[float] = None):
+        """Normalize all item probabilities to sum to 1.0, reusing a known total if given"""
+        total_prob = precomputed_total
+        if total_prob is None:
+            total_prob = sum(item.probability for item in self.items)
         if total_prob > 0:
             for item in self.items:
                 item.probability = item.probability / total_prob
+            self._probs_np = None
+    
+    def _sync_columns(self):
+        """Drop the cached item columns if items was reassigned or resized since they were built"""
+        key = (id(self.items), len(self.items))
+        if self._columns_key != key:
+            self._values_np = None
+            self._probs_np = None
+            self._rarity_codes = None
+            self._columns_key = key
+    
+    def sampling_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get cached (values, probabilities) arrays aligned with items"""
+        self._sync_columns()
+        if self._values_np is None:
+            self._values_np = np.array([item.value for item in self.items], dtype=np.float64)
+        if self._probs_np is None:
+            self._probs_np = np.array([item.probability for item in self.items], dtype=np.float64)
+        return self._values_np, self._probs_np
+    
+    def rarity_codes(self) -> np.ndarray:
+        """Get cached int8 rarity codes (see RARITY_CODE) aligned with items"""
+        self._sync_columns()
+        if self._rarity_codes is None:
+            self._rarity_codes = np.fromiter(
+                (RARITY_CODE[item.rarity] for item in self.items),
+                dtype=np.int8,
+                count=len(self.items)
+            )
+        return self._rarity_codes
+    
+    def clone_with_probs(self, probs: np.ndarray, **overrides) -> 'Lootbox':
+        """
+        Copy the lootbox with new item probabilities, bypassing validation
+        
+        Intended for optimizer hot loops; the caller guarantees that `probs`
+        is aligned with `items` and sums to 1.0.
+        """
+        # Make sure the columns copied into the clone describe self.items
+        self._sync_columns()
+        items = [
+            item.model_copy(update={'probability': float(prob)})
+            for item, prob in zip(self.items, probs)
+        ]
+        clone = self.model_copy(update={'items': items, **overrides})
+        # Values and rarities are unchanged, so the copied columns stay valid
+        clone._columns_key = (id(clone.items), len(clone.items))
+        clone._probs_np = np.array(probs, dtype=np.float64)
+        return clone
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -122,7 +209,16 @@ class Lootbox(BaseModel):
             "name": self.name,
             "description": self.description,
             "cost": self.cost,
-            "items": [item.dict() for item in self.items]
+            "items": [
+                {
+                    "name": item.name,
+                    "value": item.value,
+                    "rarity": item.rarity.value,
+                    "probability": item.probability,
+                    "description": item.description
+                }
+                for item in self.items
+            ]
         }
     
     @classmethod
@@ -138,16 +234,26 @@ class Lootbox(BaseModel):
     
     def save_to_file(self, filepath: str):
         """Save lootbox configuration to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        Path(filepath).write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
         logger.info(f"Lootbox saved to {filepath}")
     
+    async def save_to_file_async(self, filepath: str):
+        """Save lootbox configuration to JSON file on a worker thread"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.save_to_file, filepath)
+    
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Lootbox':
         """Load lootbox configuration from JSON file"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(orjson.loads(Path(filepath).read_bytes()))
+
+
+async def save_many(lootboxes: Sequence[Lootbox], filepaths: Sequence[str]):
+    """Save several lootboxes concurrently, overlapping their file I/O"""
+    await asyncio.gather(*(
+        lootbox.save_to_file_async(filepath)
+        for lootbox, filepath in zip(lootboxes, filepaths)
+    ))
 
 
 class SimulationResult(BaseModel):
@@ -211,7 +317,8 @@ class OptimizationConstraints(BaseModel):
         description="Maximum probability for each rarity tier"
     )
     
-    @validator('min_probability_per_tier', 'max_probability_per_tier')
+    @field_validator('min_probability_per_tier', 'max_probability_per_tier')
+    @classmethod
     def validate_tier_probabilities(cls, v):
         """Validate rarity tier probabilities"""
         for tier, prob in v.items():
@@ -220,6 +327,16 @@ class OptimizationConstraints(BaseModel):
         return v
 
 
+# Classification tables for LootboxAnalytics: label i covers values below
+# threshold i (and at or above threshold i-1)
+_RISK_THRESHOLDS = (0.5, 1.0, 2.0)
+_RISK_LABELS = ("Low Risk", "Medium Risk", "High Risk", "Very High Risk")
+_RATING_THRESHOLDS = (0.0, 0.1, 0.2, 0.3, 0.4)
+_RATING_LABELS = (
+    "Excellent (Player Advantage)", "Very Good", "Good", "Fair", "Poor", "Very Poor"
+)
+
+
 class LootboxAnalytics(BaseModel):
     """
     Analytics data for a lootbox configuration
@@ -236,28 +353,8 @@ class LootboxAnalytics(BaseModel):
     
     def get_risk_level(self) -> str:
         """Categorize risk level based on variance"""
-        cv = self.coefficient_of_variation
-        if cv < 0.5:
-            return "Low Risk"
-        elif cv < 1.0:
-            return "Medium Risk" 
-        elif cv < 2.0:
-            return "High Risk"
-        else:
-            return "Very High Risk"
+        return _RISK_LABELS[bisect.bisect_right(_RISK_THRESHOLDS, self.coefficient_of_variation)]
     
     def get_player_value_rating(self) -> str:
         """Rate the value proposition for players"""
-        house_edge = self.house_edge
-        if house_edge < 0:
-            return "Excellent (Player Advantage)"
-        elif house_edge < 0.1:
-            return "Very Good"
-        elif house_edge < 0.2:
-            return "Good"
-        elif house_edge < 0.3:
-            return "Fair"
-        elif house_edge < 0.4:
-            return "Poor"
-        else:
-            return "Very Poor"
+        return _RATING_LABELS[bisect.bisect_right(_RATING_THRESHOLDS, self.house_edge)]
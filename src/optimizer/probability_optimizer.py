@@ -5,16 +5,32 @@ Uses mathematical optimization techniques to find optimal probability distributi
 for lootbox items based on various constraints and objectives.
 """
 import numpy as np
-from scipy.optimize import minimize, LinearConstraint, Bounds
-from typing import List, Dict, Tuple, Optional, Callable
+from scipy.optimize import minimize, brentq, LinearConstraint, Bounds
+from typing import List, Dict, Sequence, Tuple, Optional, Callable
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
-from ..core.models import Lootbox, LootboxItem, RarityTier, OptimizationConstraints
+from ..core.models import Lootbox, LootboxItem, RarityTier, OptimizationConstraints, RARITY_CODE
 from ..calculator.expected_value import ExpectedValueCalculator
 
 logger = logging.getLogger(__name__)
 
+# Number of evenly spaced cost points evaluated by the cost range optimizers
+COST_RANGE_POINTS = 10
+
+# Number of distinct item lists whose array views are memoized
+SOA_CACHE_SIZE = 64
+
+# Number of distinct rarity layouts whose bounds and group matrices are memoized
+RARITY_CACHE_SIZE = 64
+
+# Largest standard deviation of the GA's logit mutations (0.05 in log space
+# is roughly a 5% relative change in probability)
+MAX_MUTATION_SIGMA = 0.05
+
 
 @dataclass
 class OptimizationResult:
@@ -29,14 +45,163 @@ class OptimizationResult:
     iterations: int
 
 
+@dataclass(frozen=True)
+class _ItemsSoA:
+    """
+    Structure-of-arrays view of a list of items
+    
+    Optimizers work on the contiguous value and rarity arrays and only
+    materialize LootboxItems when building the final result.
+    """
+    items: Tuple[LootboxItem, ...]
+    values: np.ndarray
+    rarity_codes: np.ndarray
+    
+    @classmethod
+    def from_items(cls, items: Sequence[LootboxItem]) -> '_ItemsSoA':
+        """Build the arrays from a list of items"""
+        return cls(
+            items=tuple(items),
+            values=np.array([item.value for item in items], dtype=np.float64),
+            rarity_codes=np.fromiter(
+                (RARITY_CODE[item.rarity] for item in items), dtype=np.int8, count=len(items)
+            )
+        )
+    
+    @classmethod
+    def from_lootbox(cls, lootbox: Lootbox) -> '_ItemsSoA':
+        """Reuse the lootbox's cached item arrays"""
+        values, _ = lootbox.sampling_arrays()
+        return cls(items=tuple(lootbox.items), values=values, rarity_codes=lootbox.rarity_codes())
+    
+    def with_probabilities(self, probabilities: np.ndarray) -> List[LootboxItem]:
+        """Copy the items with new probabilities, leaving all other fields shared"""
+        return [
+            item.model_copy(update={'probability': float(prob)})
+            for item, prob in zip(self.items, probabilities)
+        ]
+
+
 class ProbabilityOptimizer:
     """
     Advanced probability optimizer for lootbox configurations
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize optimizer
+        
+        Args:
+            seed: Random seed for reproducible genetic algorithm runs and
+                initial guesses
+        """
         self.logger = logging.getLogger(__name__)
+        self.rng = np.random.default_rng(seed)
         self.calculator = ExpectedValueCalculator()
+        
+        # Read-only per-item bound arrays and rarity group matrices, keyed by
+        # the item rarity codes (and constraint contents for bounds), least
+        # recently used first
+        self._bounds_cache: "OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._rarity_matrix_cache: "OrderedDict[bytes, Tuple[List[RarityTier], np.ndarray]]" = OrderedDict()
+        
+        # Array views of item lists, keyed by the ids of the items
+        self._soa_cache: "OrderedDict[tuple, _ItemsSoA]" = OrderedDict()
+    
+    def _items_soa(self, items: Sequence[LootboxItem]) -> _ItemsSoA:
+        """
+        Get the cached structure-of-arrays view of items, building it on first use
+        
+        Each cached view keeps references to its items, so an id in the key
+        cannot be reused by a different object while the entry is alive.
+        
+        Args:
+            items: Items to view
+            
+        Returns:
+            Array view of items
+        """
+        key = tuple(map(id, items))
+        
+        soa = self._soa_cache.get(key)
+        if soa is not None:
+            self._soa_cache.move_to_end(key)
+            return soa
+        
+        soa = self._soa_cache[key] = _ItemsSoA.from_items(items)
+        if len(self._soa_cache) > SOA_CACHE_SIZE:
+            self._soa_cache.popitem(last=False)
+        return soa
+    
+    def _item_bounds(
+        self,
+        soa: _ItemsSoA,
+        constraints: OptimizationConstraints
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get per-item (lower, upper) probability bounds from the rarity tier constraints
+        
+        Args:
+            soa: Items to bound
+            constraints: Optimization constraints
+            
+        Returns:
+            Tuple of read-only (lower, upper) arrays aligned with items
+        """
+        key = (
+            soa.rarity_codes.tobytes(),
+            tuple(constraints.min_probability_per_tier.items()),
+            tuple(constraints.max_probability_per_tier.items())
+        )
+        
+        cached = self._bounds_cache.get(key)
+        if cached is not None:
+            self._bounds_cache.move_to_end(key)
+        else:
+            # Look up each tier once, then gather by rarity code
+            tier_min = np.array([
+                constraints.min_probability_per_tier.get(tier.value, 0.0) for tier in RarityTier
+            ])
+            tier_max = np.array([
+                constraints.max_probability_per_tier.get(tier.value, 1.0) for tier in RarityTier
+            ])
+            lower, upper = tier_min[soa.rarity_codes], tier_max[soa.rarity_codes]
+            lower.flags.writeable = False
+            upper.flags.writeable = False
+            cached = self._bounds_cache[key] = (lower, upper)
+            if len(self._bounds_cache) > RARITY_CACHE_SIZE:
+                self._bounds_cache.popitem(last=False)
+        
+        return cached
+    
+    def _rarity_matrix(self, soa: _ItemsSoA) -> Tuple[List[RarityTier], np.ndarray]:
+        """
+        Get the rarity tiers present in items and their group membership matrix
+        
+        Args:
+            soa: Items to group
+            
+        Returns:
+            Tuple of (tiers, read-only (len(tiers), n_items) 0/1 matrix) where
+            row g selects the items of tiers[g]
+        """
+        key = soa.rarity_codes.tobytes()
+        
+        cached = self._rarity_matrix_cache.get(key)
+        if cached is not None:
+            self._rarity_matrix_cache.move_to_end(key)
+        else:
+            n_items = len(soa.rarity_codes)
+            present, group_of_item = np.unique(soa.rarity_codes, return_inverse=True)
+            matrix = np.zeros((len(present), n_items))
+            matrix[group_of_item, np.arange(n_items)] = 1.0
+            matrix.flags.writeable = False
+            tiers = [list(RarityTier)[code] for code in present]
+            cached = self._rarity_matrix_cache[key] = (tiers, matrix)
+            if len(self._rarity_matrix_cache) > RARITY_CACHE_SIZE:
+                self._rarity_matrix_cache.popitem(last=False)
+        
+        return cached
     
     def optimize_for_house_edge(
         self,
@@ -63,14 +228,16 @@ class ProbabilityOptimizer:
         original_he = lootbox.get_house_edge()
         
         # Set up optimization problem
-        n_items = len(lootbox.items)
-        item_values = np.array([item.value for item in lootbox.items])
+        soa = _ItemsSoA.from_lootbox(lootbox)
+        n_items = len(soa.items)
+        item_values = soa.values
         
-        # Objective: minimize deviation from target house edge
+        # Objective: minimize deviation from target house edge, with its gradient
         def objective(probabilities):
             expected_value = np.dot(probabilities, item_values)
             house_edge = (lootbox.cost - expected_value) / lootbox.cost
-            return (house_edge - target_house_edge) ** 2
+            error = house_edge - target_house_edge
+            return error ** 2, (-2 * error / lootbox.cost) * item_values
         
         # Constraints
         constraints_list = []
@@ -81,17 +248,7 @@ class ProbabilityOptimizer:
         ))
         
         # Individual probability bounds
-        lower_bounds = []
-        upper_bounds = []
-        
-        for item in lootbox.items:
-            rarity_key = item.rarity.value
-            min_prob = constraints.min_probability_per_tier.get(rarity_key, 0.0)
-            max_prob = constraints.max_probability_per_tier.get(rarity_key, 1.0)
-            
-            lower_bounds.append(min_prob)
-            upper_bounds.append(max_prob)
-        
+        lower_bounds, upper_bounds = self._item_bounds(soa, constraints)
         bounds = Bounds(lower_bounds, upper_bounds)
         
         # Initial guess (current probabilities)
@@ -99,59 +256,63 @@ class ProbabilityOptimizer:
         
         # Optimize
         try:
-            result = minimize(
-                objective,
-                initial_probs,
-                method='SLSQP',
-                bounds=bounds,
-                constraints=constraints_list,
-                options={'maxiter': 1000, 'ftol': 1e-9}
+            # The objective depends on the probabilities only through p·v, so
+            # whenever the bounds admit a distribution it is solved directly
+            probabilities = _solve_target_expected_value(
+                item_values,
+                lower_bounds,
+                upper_bounds,
+                lootbox.cost * (1 - target_house_edge)
             )
+            iterations = 0
             
-            if result.success:
-                # Create optimized lootbox
-                optimized_items = []
-                for i, item in enumerate(lootbox.items):
-                    optimized_item = LootboxItem(
-                        name=item.name,
-                        value=item.value,
-                        rarity=item.rarity,
-                        probability=float(result.x[i]),
-                        description=item.description
-                    )
-                    optimized_items.append(optimized_item)
-                
-                optimized_lootbox = Lootbox(
-                    name=f"{lootbox.name} (Optimized)",
-                    description=f"Optimized for {target_house_edge*100:.1f}% house edge",
-                    cost=lootbox.cost,
-                    items=optimized_items
+            if probabilities is None:
+                # Bounds are infeasible; let SLSQP find the least-bad point
+                result = minimize(
+                    objective,
+                    initial_probs,
+                    method='SLSQP',
+                    jac=True,
+                    bounds=bounds,
+                    constraints=constraints_list,
+                    options={'maxiter': 1000, 'ftol': 1e-9}
                 )
                 
-                optimized_ev = optimized_lootbox.get_expected_value()
-                optimized_he = optimized_lootbox.get_house_edge()
+                if not result.success:
+                    return OptimizationResult(
+                        success=False,
+                        optimized_lootbox=None,
+                        original_house_edge=original_he,
+                        optimized_house_edge=original_he,
+                        original_expected_value=original_ev,
+                        optimized_expected_value=original_ev,
+                        optimization_message=f"Optimization failed: {result.message}",
+                        iterations=result.nit if hasattr(result, 'nit') else 0
+                    )
                 
-                return OptimizationResult(
-                    success=True,
-                    optimized_lootbox=optimized_lootbox,
-                    original_house_edge=original_he,
-                    optimized_house_edge=optimized_he,
-                    original_expected_value=original_ev,
-                    optimized_expected_value=optimized_ev,
-                    optimization_message=f"Successfully optimized to {optimized_he*100:.2f}% house edge",
-                    iterations=result.nit
-                )
-            else:
-                return OptimizationResult(
-                    success=False,
-                    optimized_lootbox=None,
-                    original_house_edge=original_he,
-                    optimized_house_edge=original_he,
-                    original_expected_value=original_ev,
-                    optimized_expected_value=original_ev,
-                    optimization_message=f"Optimization failed: {result.message}",
-                    iterations=result.nit if hasattr(result, 'nit') else 0
-                )
+                probabilities = result.x
+                iterations = result.nit
+            
+            # Create optimized lootbox (both paths keep sum=1, skip revalidation)
+            optimized_lootbox = lootbox.clone_with_probs(
+                probabilities,
+                name=f"{lootbox.name} (Optimized)",
+                description=f"Optimized for {target_house_edge*100:.1f}% house edge"
+            )
+            
+            optimized_ev = float(np.dot(probabilities, item_values))
+            optimized_he = (lootbox.cost - optimized_ev) / lootbox.cost
+            
+            return OptimizationResult(
+                success=True,
+                optimized_lootbox=optimized_lootbox,
+                original_house_edge=original_he,
+                optimized_house_edge=optimized_he,
+                original_expected_value=original_ev,
+                optimized_expected_value=optimized_ev,
+                optimization_message=f"Successfully optimized to {optimized_he*100:.2f}% house edge",
+                iterations=iterations
+            )
         
         except Exception as e:
             self.logger.error(f"Optimization error: {str(e)}")
@@ -191,43 +352,79 @@ class ProbabilityOptimizer:
             constraints = OptimizationConstraints()
         
         results = []
-        cost_points = np.linspace(min_cost, max_cost, 10)
+        cost_points = np.linspace(min_cost, max_cost, COST_RANGE_POINTS)
         
         for cost in cost_points:
-            # Create temporary lootbox with equal probabilities
-            temp_items = []
-            equal_prob = 1.0 / len(items)
-            
-            for item in items:
-                temp_items.append(LootboxItem(
-                    name=item.name,
-                    value=item.value,
-                    rarity=item.rarity,
-                    probability=equal_prob,
-                    description=item.description
-                ))
-            
-            temp_lootbox = Lootbox(
-                name=f"Temp Box ${cost:.2f}",
-                cost=cost,
-                items=temp_items
-            )
-            
-            # Optimize this configuration
-            result = self.optimize_for_house_edge(temp_lootbox, target_house_edge, constraints)
-            results.append(result)
+            results.append(self._optimize_at_cost(items, cost, target_house_edge, constraints))
         
         return results
     
+    def optimize_for_cost_range_parallel(
+        self,
+        items: List[LootboxItem],
+        min_cost: float = 0.5,
+        max_cost: float = 1000.0,
+        target_house_edge: float = 0.15,
+        constraints: OptimizationConstraints = None,
+        n_workers: Optional[int] = None
+    ) -> List[OptimizationResult]:
+        """
+        Optimize lootbox for different cost points, one worker process per cost point
+        
+        Args:
+            items: List of available items
+            min_cost: Minimum cost to test
+            max_cost: Maximum cost to test
+            target_house_edge: Target house edge
+            constraints: Optimization constraints
+            n_workers: Number of worker processes (default: CPU count, at most
+                one per cost point)
+            
+        Returns:
+            List of optimization results ordered by cost
+        """
+        if constraints is None:
+            constraints = OptimizationConstraints()
+        
+        cost_points = np.linspace(min_cost, max_cost, COST_RANGE_POINTS)
+        tasks = [(items, float(cost), target_house_edge, constraints) for cost in cost_points]
+        
+        if n_workers is None:
+            n_workers = min(len(tasks), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_optimize_cost_point, tasks))
+    
+    def _optimize_at_cost(
+        self,
+        items: List[LootboxItem],
+        cost: float,
+        target_house_edge: float,
+        constraints: OptimizationConstraints
+    ) -> OptimizationResult:
+        """Optimize an equal-probability lootbox of the given items at one cost point"""
+        # Create temporary lootbox with equal probabilities
+        soa = self._items_soa(items)
+        temp_lootbox = Lootbox(
+            name=f"Temp Box ${cost:.2f}",
+            cost=cost,
+            items=soa.with_probabilities(np.full(len(items), 1.0 / len(items)))
+        )
+        
+        return self.optimize_for_house_edge(temp_lootbox, target_house_edge, constraints)
+    
     def genetic_algorithm_optimization(
         self,
         items: List[LootboxItem],
         cost: float,
         target_house_edge: float,
-        population_size: int = 100,
+        population_size: int = 40,
         generations: int = 500,
         mutation_rate: float = 0.1,
-        constraints: OptimizationConstraints = None
+        constraints: OptimizationConstraints = None,
+        patience: int = 30,
+        tol: float = 0.01,
+        elite_size: int = 5
     ) -> OptimizationResult:
         """
         Use genetic algorithm for probability optimization
@@ -236,10 +433,17 @@ class ProbabilityOptimizer:
             items: List of available items
             cost: Lootbox cost
             target_house_edge: Target house edge
-            population_size: Size of genetic algorithm population
-            generations: Number of generations to evolve
+            population_size: Size of genetic algorithm population (elitism
+                keeps the best solutions, so a small population suffices)
+            generations: Maximum number of generations to evolve
             mutation_rate: Probability of mutation
             constraints: Optimization constraints
+            patience: Stop after this many generations without the best
+                deviation from the target shrinking by more than tol
+            tol: Minimum relative reduction of the best deviation that
+                resets patience (0.01 = 1%)
+            elite_size: Number of fittest individuals carried unchanged into
+                each new generation
             
         Returns:
             Optimization result
@@ -247,132 +451,47 @@ class ProbabilityOptimizer:
         if constraints is None:
             constraints = OptimizationConstraints()
         
+        soa = self._items_soa(items)
         n_items = len(items)
-        item_values = np.array([item.value for item in items])
-        
-        # Initialize population
-        population = []
-        for _ in range(population_size):
-            # Generate random probabilities that sum to 1
-            probs = np.random.exponential(1.0, n_items)
-            probs = probs / np.sum(probs)
-            
-            # Apply constraints
-            for i, item in enumerate(items):
-                rarity_key = item.rarity.value
-                min_prob = constraints.min_probability_per_tier.get(rarity_key, 0.0)
-                max_prob = constraints.max_probability_per_tier.get(rarity_key, 1.0)
-                probs[i] = np.clip(probs[i], min_prob, max_prob)
-            
-            # Renormalize
-            probs = probs / np.sum(probs)
-            population.append(probs)
-        
-        # Fitness function
-        def fitness(probabilities):
-            expected_value = np.dot(probabilities, item_values)
-            house_edge = (cost - expected_value) / cost
-            return -abs(house_edge - target_house_edge)  # Minimize deviation
-        
-        best_individual = None
-        best_fitness = float('-inf')
-        
-        for generation in range(generations):
-            # Evaluate fitness
-            fitness_scores = [fitness(individual) for individual in population]
-            
-            # Track best
-            gen_best_idx = np.argmax(fitness_scores)
-            if fitness_scores[gen_best_idx] > best_fitness:
-                best_fitness = fitness_scores[gen_best_idx]
-                best_individual = population[gen_best_idx].copy()
-            
-            # Selection (tournament selection)
-            new_population = []
-            for _ in range(population_size):
-                tournament_indices = np.random.choice(population_size, 3, replace=False)
-                tournament_fitness = [fitness_scores[i] for i in tournament_indices]
-                winner_idx = tournament_indices[np.argmax(tournament_fitness)]
-                new_population.append(population[winner_idx].copy())
-            
-            # Crossover and mutation
-            for i in range(0, population_size - 1, 2):
-                if np.random.random() < 0.8:  # Crossover probability
-                    # Single-point crossover
-                    crossover_point = np.random.randint(1, n_items)
-                    child1 = np.concatenate([
-                        new_population[i][:crossover_point],
-                        new_population[i+1][crossover_point:]
-                    ])
-                    child2 = np.concatenate([
-                        new_population[i+1][:crossover_point],
-                        new_population[i][crossover_point:]
-                    ])
-                    
-                    # Normalize
-                    child1 = child1 / np.sum(child1)
-                    child2 = child2 / np.sum(child2)
-                    
-                    new_population[i] = child1
-                    new_population[i+1] = child2
-                
-                # Mutation
-                for j in [i, i+1]:
-                    if j < len(new_population) and np.random.random() < mutation_rate:
-                        # Add small random noise
-                        noise = np.random.normal(0, 0.01, n_items)
-                        new_population[j] += noise
-                        new_population[j] = np.clip(new_population[j], 0.001, 1.0)
-                        new_population[j] = new_population[j] / np.sum(new_population[j])
-            
-            population = new_population
+        item_values = soa.values
+        
+        # Per-item probability bounds from the rarity constraints
+        min_probs, max_probs = self._item_bounds(soa, constraints)
+        
+        # Initialize population as a (population_size, n_items) matrix of
+        # random probabilities, clipped to the constraints and renormalized
+        population = self.rng.exponential(1.0, (population_size, n_items))
+        population /= population.sum(axis=1, keepdims=True)
+        np.clip(population, min_probs, max_probs, out=population)
+        population /= population.sum(axis=1, keepdims=True)
+        
+        # Evolve in log space; softmax maps the logits back to these probabilities
+        best_individual, best_fitness, generations_run = _evolve(
+            np.log(population), item_values, cost, target_house_edge,
+            generations, mutation_rate, self.rng, patience, tol, elite_size
+        )
         
         # Create optimized lootbox from best individual
-        optimized_items = []
-        for i, item in enumerate(items):
-            optimized_item = LootboxItem(
-                name=item.name,
-                value=item.value,
-                rarity=item.rarity,
-                probability=float(best_individual[i]),
-                description=item.description
-            )
-            optimized_items.append(optimized_item)
-        
         optimized_lootbox = Lootbox(
             name=f"GA Optimized Box ${cost:.2f}",
             description=f"Genetic algorithm optimized for {target_house_edge*100:.1f}% house edge",
             cost=cost,
-            items=optimized_items
+            items=soa.with_probabilities(best_individual)
         )
         
-        # Create temporary original lootbox for comparison
-        original_items = []
-        equal_prob = 1.0 / len(items)
-        for item in items:
-            original_items.append(LootboxItem(
-                name=item.name,
-                value=item.value,
-                rarity=item.rarity,
-                probability=equal_prob,
-                description=item.description
-            ))
-        
-        original_lootbox = Lootbox(
-            name="Original",
-            cost=cost,
-            items=original_items
-        )
+        # Compare against the equal-probability configuration
+        original_ev = float(item_values.mean())
+        optimized_ev = float(np.dot(best_individual, item_values))
         
         return OptimizationResult(
             success=True,
             optimized_lootbox=optimized_lootbox,
-            original_house_edge=original_lootbox.get_house_edge(),
-            optimized_house_edge=optimized_lootbox.get_house_edge(),
-            original_expected_value=original_lootbox.get_expected_value(),
-            optimized_expected_value=optimized_lootbox.get_expected_value(),
-            optimization_message=f"Genetic algorithm completed after {generations} generations",
-            iterations=generations
+            original_house_edge=(cost - original_ev) / cost,
+            optimized_house_edge=(cost - optimized_ev) / cost,
+            original_expected_value=original_ev,
+            optimized_expected_value=optimized_ev,
+            optimization_message=f"Genetic algorithm completed after {generations_run} generations",
+            iterations=generations_run
         )
     
     def find_optimal_cost(
@@ -381,7 +500,8 @@ class ProbabilityOptimizer:
         probabilities: List[float],
         target_house_edge: float,
         min_cost: float = 0.5,
-        max_cost: float = 4.0
+        max_cost: float = 4.0,
+        values_arr: Optional[np.ndarray] = None
     ) -> Tuple[float, bool]:
         """
         Find optimal cost for given items and probabilities to achieve target house edge
@@ -392,12 +512,16 @@ class ProbabilityOptimizer:
             target_house_edge: Target house edge
             min_cost: Minimum allowed cost
             max_cost: Maximum allowed cost
+            values_arr: Precomputed item values aligned with items, to skip
+                extracting them when called in a loop
             
         Returns:
             Tuple of (optimal_cost, is_feasible)
         """
         # Calculate expected value
-        expected_value = sum(item.value * prob for item, prob in zip(items, probabilities))
+        if values_arr is None:
+            values_arr = self._items_soa(items).values
+        expected_value = float(np.dot(values_arr, np.asarray(probabilities, dtype=np.float64)))
         
         # Calculate optimal cost
         # house_edge = (cost - expected_value) / cost
@@ -441,37 +565,74 @@ class ProbabilityOptimizer:
         if constraints is None:
             constraints = OptimizationConstraints()
         
-        # Group items by rarity
-        rarity_groups = {}
-        for i, item in enumerate(items):
-            if item.rarity not in rarity_groups:
-                rarity_groups[item.rarity] = []
-            rarity_groups[item.rarity].append(i)
+        # Group items by rarity: row g of rarity_matrix selects the items of rarity_tiers[g]
+        soa = self._items_soa(items)
+        rarity_tiers, rarity_matrix = self._rarity_matrix(soa)
+        target_rarity_probs = np.array([
+            target_metrics.get(f'{rarity.value}_probability', 0.1) for rarity in rarity_tiers
+        ])
         
         # Set up optimization
         n_items = len(items)
-        item_values = np.array([item.value for item in items])
+        item_values = soa.values
         
-        # Multi-objective function
+        target_house_edge = target_metrics.get('house_edge', 0.15)
+        target_variance = target_metrics.get('variance', 1.0)
+        
+        # Multi-objective function, with its gradient
         def objective(probabilities):
             expected_value = np.dot(probabilities, item_values)
             house_edge = (cost - expected_value) / cost
             
             # Calculate variance
-            variance = np.sum(probabilities * (item_values - expected_value) ** 2)
+            deviations = item_values - expected_value
+            variance = np.dot(probabilities, deviations ** 2)
             
             # Objective components
-            house_edge_error = (house_edge - target_metrics.get('house_edge', 0.15)) ** 2
-            variance_error = (variance - target_metrics.get('variance', 1.0)) ** 2
+            house_edge_error = house_edge - target_house_edge
+            variance_error = variance - target_variance
             
             # Rarity distribution penalties
-            rarity_penalty = 0.0
-            for rarity, indices in rarity_groups.items():
-                rarity_prob = sum(probabilities[i] for i in indices)
-                target_prob = target_metrics.get(f'{rarity.value}_probability', 0.1)
-                rarity_penalty += (rarity_prob - target_prob) ** 2
+            rarity_errors = rarity_matrix @ probabilities - target_rarity_probs
+            
+            value = (
+                house_edge_error ** 2
+                + 0.1 * variance_error ** 2
+                + 0.1 * np.dot(rarity_errors, rarity_errors)
+            )
             
-            return house_edge_error + 0.1 * variance_error + 0.1 * rarity_penalty
+            # d(variance)/dp_j = (v_j - ev)^2 - 2 v_j sum_i p_i (v_i - ev)
+            variance_grad = deviations ** 2 - 2 * item_values * np.dot(probabilities, deviations)
+            gradient = (
+                (-2 * house_edge_error / cost) * item_values
+                + 0.2 * variance_error * variance_grad
+                + 0.2 * (rarity_errors @ rarity_matrix)
+            )
+            
+            return value, gradient
+        
+        # Hessian of the objective; the rarity term is constant
+        rarity_hessian = 0.2 * (rarity_matrix.T @ rarity_matrix)
+        value_outer = np.outer(item_values, item_values)
+        
+        def hessian(probabilities):
+            expected_value = np.dot(probabilities, item_values)
+            deviations = item_values - expected_value
+            variance_error = np.dot(probabilities, deviations ** 2) - target_variance
+            variance_grad = deviations ** 2 - 2 * item_values * np.dot(probabilities, deviations)
+            
+            # d2(variance)/dp_j dp_k = -2 (v_j - ev) v_k - 2 v_j (v_k - ev) + 2 v_j v_k sum(p)
+            deviation_outer = np.outer(deviations, item_values)
+            variance_hessian = (
+                -2 * (deviation_outer + deviation_outer.T)
+                + 2 * np.sum(probabilities) * value_outer
+            )
+            
+            return (
+                (2 / cost ** 2) * value_outer
+                + 0.2 * (np.outer(variance_grad, variance_grad) + variance_error * variance_hessian)
+                + rarity_hessian
+            )
         
         # Set up constraints
         constraints_list = []
@@ -480,19 +641,11 @@ class ProbabilityOptimizer:
         constraints_list.append(LinearConstraint(np.ones(n_items), 1.0, 1.0))
         
         # Rarity tier constraints
-        for rarity, indices in rarity_groups.items():
-            rarity_key = rarity.value
-            min_total_prob = constraints.min_probability_per_tier.get(rarity_key, 0.0)
-            max_total_prob = constraints.max_probability_per_tier.get(rarity_key, 1.0)
-            
-            # Create constraint matrix for this rarity
-            constraint_matrix = np.zeros(n_items)
-            for idx in indices:
-                constraint_matrix[idx] = 1.0
-            
-            constraints_list.append(LinearConstraint(
-                constraint_matrix, min_total_prob, max_total_prob
-            ))
+        constraints_list.append(LinearConstraint(
+            rarity_matrix,
+            [constraints.min_probability_per_tier.get(rarity.value, 0.0) for rarity in rarity_tiers],
+            [constraints.max_probability_per_tier.get(rarity.value, 1.0) for rarity in rarity_tiers]
+        ))
         
         # Individual bounds
         bounds = Bounds(
@@ -500,47 +653,54 @@ class ProbabilityOptimizer:
             [1.0] * n_items      # Maximum individual probability
         )
         
-        # Initial guess
-        initial_probs = np.random.dirichlet(np.ones(n_items))
+        # Initial guess: uniform draw from the simplex (Dirichlet(1, ..., 1))
+        # as the gaps between sorted uniforms on [0, 1]
+        cuts = np.sort(self.rng.random(n_items - 1))
+        initial_probs = np.diff(cuts, prepend=0.0, append=1.0)
         
         # Optimize
         try:
-            result = minimize(
-                objective,
-                initial_probs,
-                method='SLSQP',
-                bounds=bounds,
-                constraints=constraints_list,
-                options={'maxiter': 2000, 'ftol': 1e-9}
-            )
+            try:
+                result = minimize(
+                    objective,
+                    initial_probs,
+                    method='trust-constr',
+                    jac=True,
+                    hess=hessian,
+                    bounds=bounds,
+                    constraints=constraints_list,
+                    options={'maxiter': 2000, 'xtol': 1e-8, 'gtol': 1e-8}
+                )
+            except Exception as e:
+                self.logger.warning(f"trust-constr failed ({str(e)}), falling back to SLSQP")
+                result = minimize(
+                    objective,
+                    initial_probs,
+                    method='SLSQP',
+                    jac=True,
+                    bounds=bounds,
+                    constraints=constraints_list,
+                    options={'maxiter': 2000, 'ftol': 1e-9}
+                )
             
             if result.success:
-                # Create optimized lootbox
-                optimized_items = []
-                for i, item in enumerate(items):
-                    optimized_item = LootboxItem(
-                        name=item.name,
-                        value=item.value,
-                        rarity=item.rarity,
-                        probability=float(result.x[i]),
-                        description=item.description
-                    )
-                    optimized_items.append(optimized_item)
+                optimized_ev = float(np.dot(result.x, item_values))
                 
+                # Create optimized lootbox
                 optimized_lootbox = Lootbox(
                     name=f"Rarity Optimized ${cost:.2f}",
                     description="Optimized for balanced rarity distribution",
                     cost=cost,
-                    items=optimized_items
+                    items=soa.with_probabilities(result.x)
                 )
                 
                 return OptimizationResult(
                     success=True,
                     optimized_lootbox=optimized_lootbox,
                     original_house_edge=0.0,  # No original for comparison
-                    optimized_house_edge=optimized_lootbox.get_house_edge(),
+                    optimized_house_edge=(cost - optimized_ev) / cost,
                     original_expected_value=0.0,
-                    optimized_expected_value=optimized_lootbox.get_expected_value(),
+                    optimized_expected_value=optimized_ev,
                     optimization_message="Successfully optimized rarity distribution",
                     iterations=result.nit
                 )
@@ -568,3 +728,281 @@ class ProbabilityOptimizer:
                 optimization_message=f"Rarity optimization error: {str(e)}",
                 iterations=0
             )
+
+
+def _evolve(
+    logits: np.ndarray,
+    item_values: np.ndarray,
+    cost: float,
+    target_house_edge: float,
+    generations: int,
+    mutation_rate: float,
+    rng: np.random.Generator,
+    patience: int = 30,
+    tol: float = 0.01,
+    elite_size: int = 5
+) -> Tuple[np.ndarray, float, int]:
+    """
+    Run the genetic algorithm generation loop
+    
+    Chromosomes are unconstrained logits mapped to probabilities by a
+    row-wise softmax, so crossover and mutation need no clipping or
+    renormalization. Fitness, selection and crossover buffers are allocated
+    once and reused across generations. The fittest individuals survive each
+    generation unchanged, and evolution stops early once the target is hit
+    or the best fitness plateaus. The mutation size shrinks with the best
+    individual's deviation so the search can keep refining near the target,
+    and the best individual is finally tilted onto the target exactly (see
+    _tilt_to_target).
+    
+    Args:
+        logits: Initial (population_size, n_items) logit matrix
+        item_values: Item values
+        cost: Lootbox cost
+        target_house_edge: Target house edge
+        generations: Maximum number of generations to evolve
+        mutation_rate: Probability of mutation
+        rng: Random generator
+        patience: Generations without a relative improvement above tol before
+            stopping
+        tol: Minimum relative reduction of the best deviation that resets
+            patience
+        elite_size: Number of fittest individuals copied unchanged into
+            each new generation
+        
+    Returns:
+        Tuple of (best individual's probabilities, best fitness, generations run)
+    """
+    population_size, n_items = logits.shape
+    target_ev = cost * (1 - target_house_edge)
+    elite_size = min(elite_size, population_size)
+    
+    # The top elite_size individuals are carried over unchanged; the other
+    # n_offspring slots are filled by selection, crossover and mutation
+    n_offspring = population_size - elite_size
+    n_pairs = n_offspring // 2
+    even, odd = slice(0, 2 * n_pairs, 2), slice(1, 2 * n_pairs, 2)
+    
+    rows = np.arange(n_offspring)
+    columns = np.arange(n_items)
+    probabilities = np.empty_like(logits)
+    evs = np.empty(population_size)
+    fitness_scores = np.empty(population_size)
+    parents = np.empty((n_offspring, n_items))
+    new_logits = np.empty_like(logits)
+    offspring = new_logits[elite_size:]
+    head = np.empty((n_pairs, n_items), dtype=bool)
+    
+    best_individual = None
+    best_fitness = float('-inf')
+    sigma = MAX_MUTATION_SIGMA
+    plateau_fitness = float('-inf')
+    stale_generations = 0
+    generations_run = 0
+    
+    for generation in range(generations):
+        generations_run = generation + 1
+        
+        # Softmax (shifted by the row max for stability)
+        np.subtract(logits, logits.max(axis=1, keepdims=True), out=probabilities)
+        np.exp(probabilities, out=probabilities)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        
+        # Evaluate fitness (deviation from target house edge)
+        np.matmul(probabilities, item_values, out=evs)
+        np.subtract(cost, evs, out=fitness_scores)
+        fitness_scores /= cost
+        fitness_scores -= target_house_edge
+        np.abs(fitness_scores, out=fitness_scores)
+        np.negative(fitness_scores, out=fitness_scores)
+        
+        # Track best
+        gen_best_idx = np.argmax(fitness_scores)
+        if fitness_scores[gen_best_idx] > best_fitness:
+            best_fitness = fitness_scores[gen_best_idx]
+            best_individual = probabilities[gen_best_idx].copy()
+            
+            # Size mutations so a typical one moves the house edge by about
+            # the best individual's remaining deviation
+            sensitivity = np.linalg.norm(
+                best_individual * (item_values - evs[gen_best_idx])
+            ) / cost
+            if sensitivity > 0:
+                sigma = min(MAX_MUTATION_SIGMA, -best_fitness / sensitivity)
+        
+        # Early exit: target reached, or no meaningful progress for a while
+        if best_fitness > -1e-8:
+            break
+        # Fitness is minus the deviation, so this asks for the deviation to
+        # shrink by a fraction tol; the bar tightens as the search closes in
+        if best_fitness > (1 - tol) * plateau_fitness:
+            plateau_fitness = best_fitness
+            stale_generations = 0
+        else:
+            stale_generations += 1
+            if stale_generations >= patience:
+                break
+        
+        # Elitism
+        if elite_size:
+            elites = np.argpartition(fitness_scores, population_size - elite_size)[-elite_size:]
+            np.take(logits, elites, axis=0, out=new_logits[:elite_size])
+        
+        # Selection (tournament selection, contestants drawn with replacement)
+        contestants = rng.integers(0, population_size, (n_offspring, 3))
+        winners = contestants[rows, np.argmax(fitness_scores[contestants], axis=1)]
+        np.take(logits, winners, axis=0, out=parents)
+        
+        # Crossover: single-point crossover of consecutive pairs, writing the
+        # children straight into the next generation's buffer
+        crossover_points = rng.integers(1, n_items, n_pairs)
+        np.less(columns, crossover_points[:, None], out=head)
+        head |= (rng.random(n_pairs) >= 0.8)[:, None]  # Crossover probability
+        np.copyto(offspring[even], parents[odd])
+        np.copyto(offspring[even], parents[even], where=head)
+        np.copyto(offspring[odd], parents[even])
+        np.copyto(offspring[odd], parents[odd], where=head)
+        if n_offspring % 2:
+            offspring[-1] = parents[-1]
+        
+        # Mutation: perturb the logits of a random subset of offspring (elites
+        # are never mutated)
+        mutated = np.flatnonzero(rng.random(n_offspring) < mutation_rate)
+        offspring[mutated] += sigma * rng.standard_normal((len(mutated), n_items))
+        
+        # Swap buffers
+        logits, new_logits = new_logits, logits
+        offspring = new_logits[elite_size:]
+    
+    # Close the remaining gap exactly, keeping the GA's result if it was better
+    tilted = _tilt_to_target(best_individual, item_values, target_ev)
+    tilted_fitness = -abs((cost - float(np.dot(tilted, item_values))) / cost - target_house_edge)
+    if tilted_fitness > best_fitness:
+        best_individual, best_fitness = tilted, tilted_fitness
+    
+    return best_individual, float(best_fitness), generations_run
+
+
+def _tilt_to_target(
+    probabilities: np.ndarray,
+    values: np.ndarray,
+    target_ev: float
+) -> np.ndarray:
+    """
+    Exponentially tilt probabilities so their expected value hits target_ev
+    
+    Solves for the lam where p_i * exp(lam * v_i) (renormalized) has expected
+    value target_ev. The expected value is strictly increasing in lam, so the
+    root is unique, and lam = 0 returns the input. Of all distributions with
+    that expected value, the tilted one is closest to the input in KL
+    divergence.
+    
+    Args:
+        probabilities: Probabilities to correct
+        values: Item values
+        target_ev: Desired expected value
+        
+    Returns:
+        Tilted probabilities, or the input unchanged if no tilt can reach
+        target_ev
+    """
+    support = probabilities > 0
+    low, high = values[support].min(), values[support].max()
+    if not low < target_ev < high:
+        return probabilities
+    
+    # Work with values scaled to [0, 1] so the bracket is scale-free
+    scaled = (values - low) / (high - low)
+    log_probs = np.log(probabilities, where=support, out=np.full_like(probabilities, -np.inf))
+    scaled_target = (target_ev - low) / (high - low)
+    
+    def tilt(lam: float) -> np.ndarray:
+        logits = log_probs + lam * scaled
+        weights = np.exp(logits - logits.max())
+        return weights / weights.sum()
+    
+    def gap(lam: float) -> float:
+        return float(np.dot(tilt(lam), scaled)) - scaled_target
+    
+    bound = 1.0
+    while gap(-bound) > 0 or gap(bound) < 0:
+        bound *= 2
+        if bound > 1e4:
+            return probabilities
+    
+    return tilt(brentq(gap, -bound, bound, xtol=1e-15, rtol=4 * np.finfo(float).eps))
+
+
+def _fill_in_order(order: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Start from the lower bounds and hand the remaining probability mass to
+    items in `order`, each up to its upper bound
+    """
+    probabilities = lower.copy()
+    capacity = (upper - lower)[order]
+    remaining = 1.0 - lower.sum()
+    
+    # Mass already handed out before each item in the order
+    given_before = np.cumsum(capacity) - capacity
+    probabilities[order] += np.clip(remaining - given_before, 0.0, capacity)
+    return probabilities
+
+
+def _solve_target_expected_value(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    target_ev: float
+) -> Optional[np.ndarray]:
+    """
+    Closed-form minimizer of (p·v - target_ev)^2 over bounded probability vectors
+    
+    Filling the cheapest items first gives the lowest reachable expected value
+    and filling the most valuable first gives the highest. Any target between
+    the two is hit exactly by interpolating the extremes (the feasible set is
+    convex); targets outside are best served by the nearer extreme.
+    
+    Args:
+        values: Item values
+        lower: Per-item lower probability bounds
+        upper: Per-item upper probability bounds
+        target_ev: Desired expected value
+        
+    Returns:
+        Optimal probabilities, or None if the bounds admit no distribution
+    """
+    if np.any(lower > upper) or lower.sum() > 1.0 + 1e-12 or upper.sum() < 1.0 - 1e-12:
+        return None
+    
+    order = np.argsort(values)
+    low_probs = _fill_in_order(order, lower, upper)
+    high_probs = _fill_in_order(order[::-1], lower, upper)
+    low_ev = float(np.dot(low_probs, values))
+    high_ev = float(np.dot(high_probs, values))
+    
+    if target_ev <= low_ev:
+        return low_probs
+    if target_ev >= high_ev:
+        return high_probs
+    
+    weight = (target_ev - low_ev) / (high_ev - low_ev)
+    return low_probs + weight * (high_probs - low_probs)
+
+
+# Per-process optimizer for cost range workers, so its caches are shared
+# by every cost point the worker handles
+_worker_optimizer: Optional[ProbabilityOptimizer] = None
+
+
+def _init_worker():
+    """Create the worker process's optimizer"""
+    global _worker_optimizer
+    _worker_optimizer = ProbabilityOptimizer()
+
+
+def _optimize_cost_point(
+    task: Tuple[List[LootboxItem], float, float, OptimizationConstraints]
+) -> OptimizationResult:
+    """Optimize an equal-probability lootbox of the items at one cost point"""
+    items, cost, target_house_edge, constraints = task
+    return _worker_optimizer._optimize_at_cost(items, cost, target_house_edge, constraints)
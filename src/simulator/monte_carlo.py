@@ -4,35 +4,80 @@ Monte Carlo Simulation Engine for Lootbox Testing
 Performs statistical simulations to validate theoretical calculations
 and analyze lootbox performance over many trials.
 """
-import random
+import bisect
 import numpy as np
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict, Counter
-import statistics
+from typing import Callable, List, Dict, Tuple, Optional, Union
 import logging
+import weakref
 from tqdm import tqdm
+from concurrent.futures import ProcessPoolExecutor
 
-from ..core.models import Lootbox, LootboxItem, RarityTier, SimulationResult
+from ..core.models import Lootbox, LootboxItem, RarityTier, SimulationResult, RARITY_CODE
 
 logger = logging.getLogger(__name__)
 
+# Number of uniform variates drawn per refill for single openings
+UNIFORM_BLOCK_SIZE = 1024
+
+# Openings drawn per chunk in simulate_multiple_openings, sized so the
+# per-chunk buffers stay cache resident
+SAMPLE_CHUNK_SIZE = 32768
+
+# Openings per parallel validation batch; fixed so the split of the work
+# does not depend on the worker count
+VALIDATION_BATCH_SIZE = SAMPLE_CHUNK_SIZE
+
+# Value distribution bins: label i covers values below BIN_EDGES[i] (and at
+# or above BIN_EDGES[i-1])
+BIN_EDGES = np.array([0.25, 0.5, 1, 2, 5, 10, 25, 50, 100])
+BIN_LABELS = [
+    "$0.00-$0.25", "$0.25-$0.50", "$0.50-$1.00", "$1.00-$2.00", "$2.00-$5.00",
+    "$5.00-$10.00", "$10.00-$25.00", "$25.00-$50.00", "$50.00-$100.00", "$100.00+"
+]
+
 
 class MonteCarloSimulator:
     """
     Monte Carlo simulation engine for lootbox analysis
     """
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None):
         """
         Initialize simulator
         
         Args:
-            seed: Random seed for reproducible results
+            seed: Random seed for reproducible results, or a SeedSequence
+                spawned by a parent simulator
         """
         self.logger = logging.getLogger(__name__)
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        
+        # Root of this simulator's random streams: the generator draws from it
+        # directly, and batched methods spawn one child stream per batch, so
+        # seeded batched runs give the same results serially and for any
+        # worker count
+        self._seed_seq = (
+            seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        )
+        self.rng = np.random.default_rng(self._seed_seq)
+        
+        # Buffered uniforms for scalar draws, refilled a block at a time
+        self._uniforms: List[float] = []
+        self._uniform_pos = 0
+        
+        # Sampling tables by lootbox id; each entry holds a weak reference to
+        # the lootbox and its probability array, so a reused id or
+        # renormalized probabilities are detected by identity. Entries are
+        # (lootbox ref, probabilities, vectorized tables, cumulative list)
+        self._cache: Dict[int, Tuple[weakref.ref, np.ndarray, tuple, List[float]]] = {}
+    
+    def _next_uniform(self) -> float:
+        """Get the next uniform variate on [0, 1), drawing from the generator in blocks"""
+        if self._uniform_pos >= len(self._uniforms):
+            self._uniforms = self.rng.random(UNIFORM_BLOCK_SIZE).tolist()
+            self._uniform_pos = 0
+        rand = self._uniforms[self._uniform_pos]
+        self._uniform_pos += 1
+        return rand
     
     def simulate_single_opening(self, lootbox: Lootbox) -> LootboxItem:
         """
@@ -45,23 +90,173 @@ class MonteCarloSimulator:
             The item obtained from the lootbox
         """
         # Generate random number
-        rand = random.random()
+        rand = self._next_uniform()
+        
+        # Find which item was selected by binary search over cumulative probabilities
+        cumulative = self._cache_entry(lootbox)[3]
+        return lootbox.items[min(bisect.bisect_left(cumulative, rand), len(cumulative) - 1)]
+    
+    def _prepare(
+        self,
+        lootbox: Lootbox,
+        sampling_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[Callable[[int, np.random.Generator], np.ndarray], np.ndarray, np.ndarray]:
+        """
+        Get the vectorized sampling tables for a lootbox
+        
+        Args:
+            lootbox: Lootbox configuration
+            sampling_arrays: Pre-built (values, probabilities) arrays, defaults to
+                lootbox.sampling_arrays()
+            
+        Returns:
+            Tuple of (index sampler taking a draw count and a generator, item
+            values, item rarity codes)
+        """
+        return self._cache_entry(lootbox, sampling_arrays)[2]
+    
+    def _cache_entry(
+        self,
+        lootbox: Lootbox,
+        sampling_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[weakref.ref, np.ndarray, tuple, List[float]]:
+        """Get the cached sampling entry for a lootbox, building it if missing or stale"""
+        values, probs = sampling_arrays if sampling_arrays is not None else lootbox.sampling_arrays()
+        
+        cached = self._cache.get(id(lootbox))
+        if cached is not None and cached[0]() is lootbox and cached[1] is probs:
+            return cached
+        
+        # Drop entries whose lootbox has been garbage collected
+        for key in [key for key, entry in self._cache.items() if entry[0]() is None]:
+            del self._cache[key]
+        
+        # Cumulative probabilities renormalized to end at 1.0, as a list for bisect
+        cumulative = np.cumsum(probs)
+        cumulative /= cumulative[-1]
+        
+        tables = (self._make_sampler(probs), values, lootbox.rarity_codes())
+        cached = self._cache[id(lootbox)] = (weakref.ref(lootbox), probs, tables, cumulative.tolist())
+        return cached
+    
+    def _build_alias(self, probs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build a Walker alias table with Vose's O(K) algorithm
+        
+        Column i is chosen uniformly, then kept with probability accept[i] or
+        replaced by alias[i] otherwise.
         
-        # Find which item was selected based on cumulative probabilities
-        cumulative_prob = 0.0
-        for item in lootbox.items:
-            cumulative_prob += item.probability
-            if rand <= cumulative_prob:
-                return item
+        Args:
+            probs: Item probabilities (renormalized here to absorb the 1e-6
+                tolerance the model allows)
+            
+        Returns:
+            Tuple of (acceptance probabilities, alias indices)
+        """
+        n_items = len(probs)
+        scaled = (probs * (n_items / probs.sum())).tolist()
+        accept = np.ones(n_items)
+        alias = np.arange(n_items)
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            short, tall = small.pop(), large.pop()
+            accept[short] = scaled[short]
+            alias[short] = tall
+            scaled[tall] += scaled[short] - 1.0
+            (small if scaled[tall] < 1.0 else large).append(tall)
+        
+        # Columns left on either list are full up to rounding error
+        return accept, alias
+    
+    def _make_sampler(self, probs: np.ndarray) -> Callable[[int, np.random.Generator], np.ndarray]:
+        """
+        Build an item index sampler specialized to a lootbox's probability shape
+        
+        Single-item lootboxes need no randomness and equal-probability
+        lootboxes draw indices directly; everything else goes through a
+        Walker alias table. The generator is passed per call, so one cached
+        sampler serves every random stream.
+        
+        Args:
+            probs: Item probabilities
+            
+        Returns:
+            Function drawing the given number of item indices from a generator
+        """
+        n_items = len(probs)
+        
+        if n_items == 1:
+            return lambda size, rng: np.zeros(size, dtype=np.intp)
         
-        # Fallback to last item (should not happen with properly normalized probabilities)
-        return lootbox.items[-1]
+        if np.ptp(probs) <= 1e-12:
+            return lambda size, rng: rng.integers(0, n_items, size)
+        
+        accept, alias = self._build_alias(probs)
+        
+        def sample_alias(size: int, rng: np.random.Generator) -> np.ndarray:
+            columns = rng.integers(0, n_items, size)
+            return np.where(rng.random(size) < accept[columns], columns, alias[columns])
+        
+        return sample_alias
+    
+    def _count_openings(
+        self,
+        sampler: Callable[[int, np.random.Generator], np.ndarray],
+        n_items: int,
+        num_simulations: int,
+        rng: np.random.Generator,
+        progress: Optional[tqdm] = None
+    ) -> np.ndarray:
+        """
+        Draw openings in chunks and count how often each item was obtained
+        
+        Args:
+            sampler: Item index sampler (see _make_sampler)
+            n_items: Number of items
+            num_simulations: Number of openings
+            rng: Random generator to draw from
+            progress: Progress bar to advance once per chunk
+            
+        Returns:
+            Per-item counts
+        """
+        item_counts = np.zeros(n_items, dtype=np.int64)
+        for start in range(0, num_simulations, SAMPLE_CHUNK_SIZE):
+            idx = sampler(min(SAMPLE_CHUNK_SIZE, num_simulations - start), rng)
+            item_counts += np.bincount(idx, minlength=n_items)
+            if progress is not None:
+                progress.update(len(idx))
+        return item_counts
+    
+    def _seeded_counts(
+        self,
+        lootbox: Lootbox,
+        num_simulations: int,
+        seed: np.random.SeedSequence
+    ) -> np.ndarray:
+        """Count item draws for one batch of openings on the stream seeded by seed"""
+        sampler, values, _ = self._prepare(lootbox)
+        return self._count_openings(sampler, len(values), num_simulations, np.random.default_rng(seed))
+    
+    def _seeded_metrics(
+        self,
+        lootbox: Lootbox,
+        num_simulations: int,
+        seed: np.random.SeedSequence
+    ) -> Tuple[float, float, float, float]:
+        """Confidence interval metrics (see _batch_metrics) of one batch on the stream seeded by seed"""
+        _, values, rarity_codes = self._prepare(lootbox)
+        item_counts = self._seeded_counts(lootbox, num_simulations, seed)
+        return _batch_metrics(self._summarize(lootbox, values, rarity_codes, item_counts))
     
     def simulate_multiple_openings(
         self,
         lootbox: Lootbox,
         num_simulations: int = 10000,
-        show_progress: bool = True
+        show_progress: bool = True,
+        sampling_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
     ) -> SimulationResult:
         """
         Simulate opening multiple lootboxes
@@ -69,42 +264,76 @@ class MonteCarloSimulator:
         Args:
             lootbox: Lootbox configuration
             num_simulations: Number of simulations to run
-            show_progress: Whether to show progress bar
+            show_progress: Whether to show progress (updated once per chunk of
+                draws rather than per opening)
+            sampling_arrays: Pre-built (values, probabilities) arrays, defaults to
+                lootbox.sampling_arrays()
             
         Returns:
             Simulation results
         """
         self.logger.info(f"Running {num_simulations:,} simulations for '{lootbox.name}'")
         
-        # Track results
-        obtained_items = []
-        obtained_values = []
-        rarity_counts = defaultdict(int)
-        value_counts = defaultdict(int)
+        sampler, values, rarity_codes = self._prepare(lootbox, sampling_arrays)
         
-        # Run simulations
-        iterator = tqdm(range(num_simulations), desc="Simulating") if show_progress else range(num_simulations)
+        # Draw openings in cache-sized chunks, accumulating a per-item
+        # histogram instead of keeping every draw; every statistic below
+        # follows from the histogram, so the drawn values are never gathered
+        progress = tqdm(total=num_simulations, desc="Simulating") if show_progress else None
+        item_counts = self._count_openings(sampler, len(values), num_simulations, self.rng, progress)
+        if progress is not None:
+            progress.close()
+        
+        return self._summarize(lootbox, values, rarity_codes, item_counts)
+    
+    def _summarize(
+        self,
+        lootbox: Lootbox,
+        values: np.ndarray,
+        rarity_codes: np.ndarray,
+        item_counts: np.ndarray
+    ) -> SimulationResult:
+        """
+        Build simulation results from per-item draw counts
         
-        for _ in iterator:
-            item = self.simulate_single_opening(lootbox)
-            obtained_items.append(item)
-            obtained_values.append(item.value)
-            rarity_counts[item.rarity.value] += 1
+        Args:
+            lootbox: Lootbox configuration
+            values: Item values
+            rarity_codes: Item rarity codes
+            item_counts: Number of times each item was drawn
             
-            # Bin values for distribution analysis
-            value_bin = self._get_value_bin(item.value)
-            value_counts[value_bin] += 1
+        Returns:
+            Simulation results
+        """
+        num_simulations = int(item_counts.sum())
+        
+        # Fold the item counts into rarity and value bins
+        tier_counts = np.bincount(
+            rarity_codes, weights=item_counts, minlength=len(RARITY_CODE)
+        )
+        rarity_counts = {
+            tier.value: int(count)
+            for tier, count in zip(RarityTier, tier_counts) if count
+        }
+        bin_counts = np.bincount(
+            np.digitize(values, BIN_EDGES), weights=item_counts, minlength=len(BIN_LABELS)
+        )
+        value_counts = {
+            label: int(count)
+            for label, count in zip(BIN_LABELS, bin_counts) if count
+        }
         
         # Calculate statistics
         total_cost = num_simulations * lootbox.cost
-        total_value = sum(obtained_values)
-        average_value = statistics.mean(obtained_values)
-        median_value = statistics.median(obtained_values)
-        std_deviation = statistics.stdev(obtained_values) if len(obtained_values) > 1 else 0.0
+        total_value = float(np.dot(item_counts, values))
+        average_value = total_value / num_simulations if num_simulations else 0.0
+        m2 = float(np.dot(item_counts, (values - average_value) ** 2))
+        median_value = _histogram_median(values, item_counts)
+        std_deviation = float(np.sqrt(m2 / (num_simulations - 1))) if num_simulations > 1 else 0.0
         
         # Calculate probabilities
-        profitable_outcomes = sum(1 for value in obtained_values if value > lootbox.cost)
-        break_even_outcomes = sum(1 for value in obtained_values if value >= lootbox.cost)
+        profitable_outcomes = int(item_counts[values > lootbox.cost].sum())
+        break_even_outcomes = int(item_counts[values >= lootbox.cost].sum())
         
         profit_probability = profitable_outcomes / num_simulations
         break_even_probability = break_even_outcomes / num_simulations
@@ -125,8 +354,8 @@ class MonteCarloSimulator:
             break_even_probability=break_even_probability,
             house_edge_actual=house_edge_actual,
             house_edge_theoretical=house_edge_theoretical,
-            value_distribution=dict(value_counts),
-            rarity_distribution=dict(rarity_counts)
+            value_distribution=value_counts,
+            rarity_distribution=rarity_counts
         )
     
     def _get_value_bin(self, value: float) -> str:
@@ -139,26 +368,7 @@ class MonteCarloSimulator:
         Returns:
             Value bin string
         """
-        if value < 0.25:
-            return "$0.00-$0.25"
-        elif value < 0.50:
-            return "$0.25-$0.50"
-        elif value < 1.00:
-            return "$0.50-$1.00"
-        elif value < 2.00:
-            return "$1.00-$2.00"
-        elif value < 5.00:
-            return "$2.00-$5.00"
-        elif value < 10.00:
-            return "$5.00-$10.00"
-        elif value < 25.00:
-            return "$10.00-$25.00"
-        elif value < 50.00:
-            return "$25.00-$50.00"
-        elif value < 100.00:
-            return "$50.00-$100.00"
-        else:
-            return "$100.00+"
+        return BIN_LABELS[int(np.digitize(value, BIN_EDGES))]
     
     def analyze_streak_patterns(
         self,
@@ -180,58 +390,34 @@ class MonteCarloSimulator:
         if min_value_threshold is None:
             min_value_threshold = lootbox.cost
         
-        # Simulate outcomes
-        outcomes = []
-        for _ in range(num_simulations):
-            item = self.simulate_single_opening(lootbox)
-            outcomes.append(item.value >= min_value_threshold)
-        
-        # Analyze streaks
-        win_streaks = []
-        loss_streaks = []
-        current_streak = 0
-        current_is_win = None
-        
-        for outcome in outcomes:
-            if current_is_win is None:
-                current_is_win = outcome
-                current_streak = 1
-            elif outcome == current_is_win:
-                current_streak += 1
-            else:
-                # Streak ended
-                if current_is_win:
-                    win_streaks.append(current_streak)
-                else:
-                    loss_streaks.append(current_streak)
-                
-                current_is_win = outcome
-                current_streak = 1
-        
-        # Add final streak
-        if current_is_win is not None:
-            if current_is_win:
-                win_streaks.append(current_streak)
-            else:
-                loss_streaks.append(current_streak)
+        # Simulate outcomes in one block of draws; classify each item once and
+        # gather the flags rather than materializing the drawn values
+        sampler, values, _ = self._prepare(lootbox)
+        idx = sampler(num_simulations, self.rng)
+        wins = (values >= min_value_threshold)[idx]
+        
+        # Analyze streaks; the win runs cover every win, so their total
+        # length doubles as the win count
+        max_win, max_loss, total_wins, total_losses, n_win, n_loss = _scan_streaks(wins)
         
         return {
-            "total_wins": sum(outcomes),
-            "total_losses": len(outcomes) - sum(outcomes),
-            "win_rate": sum(outcomes) / len(outcomes),
-            "max_win_streak": max(win_streaks) if win_streaks else 0,
-            "max_loss_streak": max(loss_streaks) if loss_streaks else 0,
-            "avg_win_streak": statistics.mean(win_streaks) if win_streaks else 0,
-            "avg_loss_streak": statistics.mean(loss_streaks) if loss_streaks else 0,
-            "num_win_streaks": len(win_streaks),
-            "num_loss_streaks": len(loss_streaks)
+            "total_wins": total_wins,
+            "total_losses": total_losses,
+            "win_rate": total_wins / num_simulations,
+            "max_win_streak": max_win,
+            "max_loss_streak": max_loss,
+            "avg_win_streak": total_wins / n_win if n_win else 0,
+            "avg_loss_streak": total_losses / n_loss if n_loss else 0,
+            "num_win_streaks": n_win,
+            "num_loss_streaks": n_loss
         }
     
     def calculate_confidence_intervals(
         self,
         lootbox: Lootbox,
         num_simulations: int = 10000,
-        confidence_level: float = 0.95
+        confidence_level: float = 0.95,
+        n_workers: Optional[int] = None
     ) -> Dict[str, Tuple[float, float]]:
         """
         Calculate confidence intervals for key metrics
@@ -240,6 +426,8 @@ class MonteCarloSimulator:
             lootbox: Lootbox configuration
             num_simulations: Number of simulations
             confidence_level: Confidence level (0.95 = 95%)
+            n_workers: Number of worker processes for the simulation batches
+                (default: run batches in this process)
             
         Returns:
             Dictionary with confidence intervals
@@ -248,32 +436,33 @@ class MonteCarloSimulator:
         batch_size = 1000
         num_batches = num_simulations // batch_size
         
-        batch_results = {
-            'expected_values': [],
-            'house_edges': [],
-            'std_deviations': [],
-            'profit_probabilities': []
-        }
+        # One row per batch, one column per metric (see _batch_metrics)
+        metrics = ('expected_values', 'house_edges', 'std_deviations', 'profit_probabilities')
+        batch_results = np.empty((num_batches, len(metrics)))
         
-        for _ in range(num_batches):
-            result = self.simulate_multiple_openings(lootbox, batch_size, show_progress=False)
-            batch_results['expected_values'].append(result.average_value_per_box)
-            batch_results['house_edges'].append(result.house_edge_actual)
-            batch_results['std_deviations'].append(result.std_deviation)
-            batch_results['profit_probabilities'].append(result.profit_probability)
+        # Independent PCG64 streams per batch, spawned from this simulator's
+        # seed; both paths draw batch i from stream i
+        seeds = self._seed_seq.spawn(num_batches)
+        if n_workers is not None and n_workers > 1:
+            tasks = [(batch_size, seed) for seed in seeds]
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_init_worker, initargs=(lootbox,)
+            ) as executor:
+                for i, row in enumerate(executor.map(_run_batch, tasks)):
+                    batch_results[i] = row
+        else:
+            for i, seed in enumerate(seeds):
+                batch_results[i] = self._seeded_metrics(lootbox, batch_size, seed)
         
-        # Calculate confidence intervals
+        # Calculate confidence intervals (both percentiles of every metric in one call)
         alpha = 1 - confidence_level
-        intervals = {}
-        
-        for metric, values in batch_results.items():
-            lower_percentile = (alpha / 2) * 100
-            upper_percentile = (1 - alpha / 2) * 100
-            
-            lower_bound = np.percentile(values, lower_percentile)
-            upper_bound = np.percentile(values, upper_percentile)
-            
-            intervals[metric] = (lower_bound, upper_bound)
+        lower_bounds, upper_bounds = np.percentile(
+            batch_results, [(alpha / 2) * 100, (1 - alpha / 2) * 100], axis=0
+        )
+        intervals = {
+            metric: (lower_bounds[j], upper_bounds[j])
+            for j, metric in enumerate(metrics)
+        }
         
         return intervals
     
@@ -281,7 +470,9 @@ class MonteCarloSimulator:
         self,
         lootbox: Lootbox,
         num_simulations: int = 100000,
-        tolerance: float = 0.01
+        tolerance: float = 0.01,
+        show_progress: bool = True,
+        n_workers: Optional[int] = None
     ) -> Dict[str, bool]:
         """
         Validate that simulation results match theoretical probabilities
@@ -290,27 +481,64 @@ class MonteCarloSimulator:
             lootbox: Lootbox configuration
             num_simulations: Number of simulations
             tolerance: Acceptable deviation from theoretical values
+            show_progress: Whether to show progress (updated once per chunk of
+                draws)
+            n_workers: Number of worker processes to run the simulation
+                batches on (default: run in this process)
             
         Returns:
             Dictionary indicating which metrics passed validation
         """
-        result = self.simulate_multiple_openings(lootbox, num_simulations, show_progress=True)
+        sampler, values, rarity_codes = self._prepare(lootbox)
+        
+        # Fixed-size batches, each with an independent PCG64 stream, so the
+        # draws do not depend on the worker count; workers return per-item
+        # histograms, so only O(K) data crosses process boundaries
+        sizes = [
+            min(VALIDATION_BATCH_SIZE, num_simulations - start)
+            for start in range(0, num_simulations, VALIDATION_BATCH_SIZE)
+        ]
+        seeds = self._seed_seq.spawn(len(sizes))
+        
+        progress = tqdm(total=num_simulations, desc="Validating") if show_progress else None
+        item_counts = np.zeros(len(values), dtype=np.int64)
+        if n_workers is not None and n_workers > 1:
+            tasks = list(zip(sizes, seeds))
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_init_worker, initargs=(lootbox,)
+            ) as executor:
+                for size, counts in zip(sizes, executor.map(_run_count_batch, tasks)):
+                    item_counts += counts
+                    if progress is not None:
+                        progress.update(size)
+        else:
+            for size, seed in zip(sizes, seeds):
+                item_counts += self._count_openings(
+                    sampler, len(values), size, np.random.default_rng(seed), progress
+                )
+        if progress is not None:
+            progress.close()
+        
+        tier_counts = np.bincount(rarity_codes, weights=item_counts, minlength=len(RARITY_CODE))
+        tier_probs = np.bincount(
+            rarity_codes, weights=lootbox.sampling_arrays()[1], minlength=len(RARITY_CODE)
+        )
         
         # Check expected value
         theoretical_ev = lootbox.get_expected_value()
-        actual_ev = result.average_value_per_box
+        actual_ev = float(np.dot(item_counts, values)) / num_simulations
         ev_valid = abs(theoretical_ev - actual_ev) / theoretical_ev < tolerance
         
         # Check house edge
         theoretical_he = lootbox.get_house_edge()
-        actual_he = result.house_edge_actual
+        actual_he = (lootbox.cost - actual_ev) / lootbox.cost
         he_valid = abs(theoretical_he - actual_he) < tolerance
         
         # Check rarity distributions
         rarity_valid = {}
         for rarity in RarityTier:
-            theoretical_prob = lootbox.get_probability_by_rarity(rarity)
-            actual_count = result.rarity_distribution.get(rarity.value, 0)
+            theoretical_prob = float(tier_probs[RARITY_CODE[rarity]])
+            actual_count = int(tier_counts[RARITY_CODE[rarity]])
             actual_prob = actual_count / num_simulations
             
             if theoretical_prob > 0:
@@ -329,3 +557,90 @@ class MonteCarloSimulator:
             "rarity_validations": rarity_valid,
             "overall_valid": ev_valid and he_valid and all(rarity_valid.values())
         }
+
+
+def _histogram_median(values: np.ndarray, counts: np.ndarray) -> float:
+    """
+    Exact median of a sample given as per-value counts
+    
+    Args:
+        values: Distinct sample values
+        counts: Number of occurrences of each value
+        
+    Returns:
+        Median of the expanded sample (mean of the two middle values for an
+        even sample size)
+    """
+    order = np.argsort(values, kind='stable')
+    sorted_values = values[order]
+    cumulative = np.cumsum(counts[order])
+    total = int(cumulative[-1])
+    
+    # Value at 0-based rank r is the first whose cumulative count exceeds r
+    lower, upper = np.searchsorted(cumulative, [(total - 1) // 2, total // 2], side='right')
+    return float((sorted_values[lower] + sorted_values[upper]) / 2)
+
+
+def _scan_streaks(outcomes: np.ndarray) -> Tuple[int, int, int, int, int, int]:
+    """
+    Measure win/loss streaks by run-length encoding the outcomes
+    
+    Args:
+        outcomes: Boolean array, True for a win
+        
+    Returns:
+        Tuple of (max win streak, max loss streak, total win streak length,
+        total loss streak length, number of win streaks, number of loss streaks)
+    """
+    if not len(outcomes):
+        return 0, 0, 0, 0, 0, 0
+    
+    # Runs start at index 0 and wherever the outcome changes
+    changes = np.flatnonzero(outcomes[1:] != outcomes[:-1]) + 1
+    boundaries = np.concatenate(([0], changes, [len(outcomes)]))
+    lengths = np.diff(boundaries)
+    kinds = outcomes[boundaries[:-1]]
+    
+    win_lengths = lengths[kinds]
+    loss_lengths = lengths[~kinds]
+    return (
+        int(win_lengths.max(initial=0)), int(loss_lengths.max(initial=0)),
+        int(win_lengths.sum()), int(loss_lengths.sum()),
+        len(win_lengths), len(loss_lengths)
+    )
+
+
+def _batch_metrics(result: SimulationResult) -> Tuple[float, float, float, float]:
+    """Extract the confidence interval metrics from one simulation batch"""
+    return (
+        result.average_value_per_box,
+        result.house_edge_actual,
+        result.std_deviation,
+        result.profit_probability
+    )
+
+
+# Per-process simulator and lootbox for batch workers, so the sampling
+# tables are built once per worker rather than once per batch
+_worker_simulator: Optional[MonteCarloSimulator] = None
+_worker_lootbox: Optional[Lootbox] = None
+
+
+def _init_worker(lootbox: Lootbox):
+    """Create the worker process's simulator and build its sampling tables"""
+    global _worker_simulator, _worker_lootbox
+    _worker_simulator = MonteCarloSimulator()
+    _worker_lootbox = lootbox
+    _worker_simulator._prepare(lootbox)
+
+
+def _run_batch(task: Tuple[int, np.random.SeedSequence]) -> Tuple[float, float, float, float]:
+    """Confidence interval metrics of one batch of openings drawn from the seeded stream"""
+    batch_size, seed = task
+    return _worker_simulator._seeded_metrics(_worker_lootbox, batch_size, seed)
+
+
+def _run_count_batch(task: Tuple[int, np.random.SeedSequence]) -> np.ndarray:
+    """Per-item counts of one batch of openings drawn from the seeded stream"""
+    num_simulations, seed = task
+    return _worker_simulator._seeded_counts(_worker_lootbox, num_simulations, seed)
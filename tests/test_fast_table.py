@@ -0,0 +1,41 @@
+"""
+Tests for the CLI grid table renderer against tabulate's 'grid' format
+"""
+import pytest
+
+from src.cli.fast_table import render_grid
+
+tabulate = pytest.importorskip("tabulate").tabulate
+
+
+@pytest.mark.parametrize("headers, rows", [
+    # Tables as printed by analyze, simulate, show and cost_analysis
+    (
+        ['Rarity', 'Items', 'Probability', 'Avg Value', 'EV Contribution'],
+        [['Common', 3, '79.92%', '$0.05', '$0.0400'], ['Mythic', 1, '0.13%', '$75.00', '$0.0975']]
+    ),
+    (
+        ['Name', 'Rarity', 'Value', 'Probability', 'Description'],
+        [['Consumer', 'Common', '$0.05', '79.9200%', ''], ['Covert', 'Mythic', '$75.00', '0.1300%', 'rare']]
+    ),
+    # Numeric strings, decimal alignment and empty tables
+    (['Name', 'Value'], [['123', 1.5], ['4.5', 10.25], ['007', None]]),
+    (['A', 'B'], []),
+])
+def test_matches_tabulate(headers, rows):
+    assert render_grid(headers, rows) == tabulate(rows, headers=headers, tablefmt='grid')
+
+
+@pytest.mark.parametrize("headers, rows", [
+    (['Name', 'Description'], [['Gem', 'Shiny\nand rare'], ['Coin', '']]),
+    (['Name\n(display)', 'Value'], [['Multi\nline\nname', 3], ['x', 4.5]]),
+    (['Name', 'Description'], [['Trailing\n', ''], ['', ''], [' padded\n lines ', 'a']]),
+])
+def test_multiline_cells_match_tabulate(headers, rows):
+    assert render_grid(headers, rows) == tabulate(rows, headers=headers, tablefmt='grid')
+
+
+def test_tabs_are_expanded():
+    lines = render_grid(['Name'], [['a\tb']]).splitlines()
+    assert '\t' not in lines[3]
+    assert len({len(line) for line in lines}) == 1